@@ -1,4 +1,6 @@
 from .parser import SeedParser, ParseError
+from .analyzer import Analyzer, AnalysisError
 from .generator import Generator
+from .data import release_data
 
 __version__ = '0.1.0'
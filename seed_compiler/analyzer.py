@@ -0,0 +1,173 @@
+from types import MappingProxyType
+from .field_types import FIELD_TYPES
+from .data import DataError, convert_record, read_records
+
+class AnalysisError(Exception):
+    """Error for specs that parse but do not resolve (unknown models or fields)"""
+
+def freeze(value):
+    """Recursively convert dicts and lists into read-only mappings and tuples"""
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def is_ir(spec) -> bool:
+    """Check whether a spec has already been through the analyzer"""
+    return isinstance(spec, MappingProxyType)
+
+class Analyzer:
+    """Resolves a parsed spec into a frozen intermediate representation (IR)
+
+    The IR resolves every reference once, so the generator and templates can
+    read model indexes, reverse references and import lists directly:
+
+    - models: tuple of models, each with 'index', 'references' (models its
+      fields point to, in field order), 'referenced_by' and per-field
+      'is_reference'/'ref_index'
+    - screens: tuple of screens whose 'model' is the resolved model and whose
+      'imports' lists every model hook the screen file needs
+    - model_index: model name -> position in models
+    - theme / dark_theme: the resolved themes the app uses (see ThemeResolver),
+      or None
+    - data: seed data sets, each with its 'model', record 'count', content
+      'version' and 'sha256', and the 'path' of its records file (read with
+      read_records); models list theirs in 'data_sets'
+    """
+
+    def __init__(self, theme_resolver=None):
+        self.valid_types = FIELD_TYPES
+        if theme_resolver is None:
+            from .themes import ThemeResolver
+            theme_resolver = ThemeResolver()
+        self.theme_resolver = theme_resolver
+
+    def analyze(self, spec) -> MappingProxyType:
+        """Resolve and validate a parsed spec, returning the frozen IR"""
+        if is_ir(spec):
+            return spec
+
+        model_index = {}
+        for index, model in enumerate(spec.get('models', [])):
+            if model['name'] in model_index:
+                raise AnalysisError(f"Duplicate model name: {model['name']}")
+            model_index[model['name']] = index
+
+        models = [self._resolve_model(model, index, model_index)
+                  for index, model in enumerate(spec.get('models', []))]
+
+        # Reverse references, in model declaration order
+        referenced_by = {model['name']: [] for model in models}
+        for model in models:
+            for ref in model['references']:
+                referenced_by[ref].append(model['name'])
+        for model in models:
+            model['referenced_by'] = referenced_by[model['name']]
+        
+        data = [self._resolve_data(data_set, models, model_index) for data_set in spec.get('data', [])]
+        for model in models:
+            model['data_sets'] = [
+                {'name': data_set['name'], 'count': data_set['count'], 'version': data_set['version']}
+                for data_set in data if data_set['model'] == model['name']
+            ]
+
+        frozen_models = freeze(models)
+        screens = [self._resolve_screen(screen, frozen_models, model_index)
+                   for screen in spec.get('screens', [])]
+
+        ir = {key: value for key, value in spec.items() if key not in ('models', 'screens', 'data')}
+        ir['models'] = frozen_models
+        ir['screens'] = tuple(MappingProxyType(screen) for screen in screens)
+        ir['model_index'] = model_index
+        ir['data'] = tuple(MappingProxyType(data_set) for data_set in data)
+        ir['theme'], ir['dark_theme'] = self._resolve_themes(spec)
+        return freeze(ir)
+
+    def _resolve_themes(self, spec) -> tuple:
+        """Resolve every declared theme and return the app's (theme, dark theme)"""
+        app = spec.get('app') or {}
+        used = list(app.get('themes') or ([app['theme']] if app.get('theme') else []))
+        if not used and not spec.get('themes'):
+            return None, None
+        resolved = self.theme_resolver.resolve_all(spec.get('themes', []), used)
+        used += [None] * (2 - len(used))
+        return tuple(resolved[name] if name else None for name in used)
+
+    def _resolve_model(self, model: dict, index: int, model_index: dict) -> dict:
+        """Resolve field references of a single model"""
+        fields = []
+        references = []
+        for field in model.get('fields', []):
+            is_reference = field['type'] not in self.valid_types
+            ref_index = None
+            if is_reference:
+                if field['type'] not in model_index:
+                    raise AnalysisError(
+                        f"Field '{model['name']}.{field['name']}' references unknown model '{field['type']}'"
+                    )
+                ref_index = model_index[field['type']]
+                if field['type'] not in references:
+                    references.append(field['type'])
+            fields.append({
+                'default': None,
+                'is_title': False,
+                **field,
+                'is_reference': is_reference,
+                'ref_index': ref_index
+            })
+
+        return {
+            **model,
+            'index': index,
+            'fields': fields,
+            'references': references
+        }
+
+    def _resolve_data(self, data_set, models: list, model_index: dict) -> dict:
+        """Check a seed data set's records against its model, reading them one at a time"""
+        if data_set['model'] not in model_index:
+            raise AnalysisError(f"Data set '{data_set['name']}' uses unknown model '{data_set['model']}'")
+        model = models[model_index[data_set['model']]]
+        fields = {field['name']: field for field in model['fields']}
+        try:
+            for number, record in enumerate(read_records(data_set), 1):
+                convert_record(record, fields, data_set['name'], number)
+        except DataError as e:
+            raise AnalysisError(str(e))
+        return {
+            'name': data_set['name'],
+            'model': data_set['model'],
+            'count': data_set['count'],
+            'version': data_set['sha256'][:12],
+            'sha256': data_set['sha256'],
+            'path': data_set['path']
+        }
+
+    def _resolve_screen(self, screen: dict, models: tuple, model_index: dict) -> dict:
+        """Resolve the model a screen uses and the fields its list options name"""
+        model_name = screen['model']
+        if model_name not in model_index:
+            raise AnalysisError(f"Screen '{screen['name']}' uses unknown model '{model_name}'")
+        model = models[model_index[model_name]]
+
+        field_names = {field['name'] for field in model['fields']}
+        option_fields = []
+        if screen.get('sort'):
+            option_fields.append(('sort', screen['sort']['field']))
+        if screen.get('filter'):
+            option_fields.append(('filter', screen['filter']))
+        for option, field_name in option_fields:
+            if field_name not in field_names:
+                raise AnalysisError(
+                    f"Screen '{screen['name']}' cannot {option} by unknown field '{model_name}.{field_name}'"
+                )
+
+        return {
+            **freeze(screen),
+            'model': model,
+            'model_index': model_index[model_name],
+            'imports': (model_name,) + model['references']
+        }
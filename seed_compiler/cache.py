@@ -0,0 +1,115 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+def _canonical(value):
+    """JSON fallback for IR values (read-only mappings and sets)"""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot hash context value of type {type(value).__name__}")
+
+def context_hash(context) -> str:
+    """Canonical hash of a template context, independent of key order"""
+    if isinstance(context, MappingProxyType):
+        context = dict(context)
+    encoded = json.dumps(context, sort_keys=True, separators=(',', ':'), default=_canonical)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+class RenderCache:
+    """Content-addressed cache of rendered template output
+
+    Entries are keyed by template name, template source hash and a canonical
+    hash of the context, so identical renders are served without invoking
+    Jinja. Memory entries are bounded (least recently used are dropped);
+    with cache_dir set, entries are also stored on disk and survive restarts.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=2048):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(template_name: str, source_hash: str, context) -> str:
+        """Build the cache key for one render"""
+        key = f"{template_name}\0{source_hash}\0{context_hash(context)}"
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def get(self, key: str):
+        """Return cached output for a key, or None"""
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return content
+
+        content = self._read_disk(key)
+        with self._lock:
+            if content is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, content)
+        return content
+
+    def put(self, key: str, content: str):
+        """Store rendered output under a key"""
+        with self._lock:
+            self._store(key, content)
+        self._write_disk(key, content)
+
+    def clear(self):
+        """Drop all in-memory entries (disk entries are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, key: str, content: str):
+        self._entries[key] = content
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _read_disk(self, key: str):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(key), encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, content: str):
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so concurrent readers never see partial entries
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+_shared_caches = {}
+_shared_lock = threading.Lock()
+
+def shared_render_cache(cache_dir=None) -> RenderCache:
+    """Process-wide RenderCache for a cache directory (or memory only)"""
+    key = os.path.abspath(cache_dir) if cache_dir else None
+    with _shared_lock:
+        if key not in _shared_caches:
+            _shared_caches[key] = RenderCache(cache_dir=key)
+        return _shared_caches[key]
@@ -3,7 +3,12 @@ import sys
 import os
 from pathlib import Path
 from .parser import SeedParser, ParseError
+from .analyzer import Analyzer
+from .data import release_data
 from .generator import Generator
+from .modules import ModuleCache
+from .themes import ThemeResolver
+from .profiler import TemplateProfiler
 
 def main(argv=None):
     """Main entry point for the seed compiler CLI"""
@@ -33,6 +38,75 @@ def main(argv=None):
         help='Enable verbose output'
     )
 
+    parser.add_argument(
+        '--lazy-routes',
+        action='store_true',
+        help='Load each screen on demand with React.lazy'
+    )
+    
+    parser.add_argument(
+        '--prefetch',
+        action='store_true',
+        help='Prefetch lazy screens when their navigation link is hovered (requires --lazy-routes)'
+    )
+
+    parser.add_argument(
+        '--static-css',
+        action='store_true',
+        help='Write a precompiled stylesheet instead of loading the Tailwind CDN at runtime'
+    )
+
+    parser.add_argument(
+        '--shared-components',
+        action='store_true',
+        help='Emit shared form and row components once instead of inlining them in every screen'
+    )
+
+    parser.add_argument(
+        '--data-chunk-size',
+        type=int,
+        default=1000,
+        help='Records per seed data file under public/data (default: 1000)'
+    )
+
+    parser.add_argument(
+        '--backend',
+        choices=['sqlite'],
+        default=None,
+        help='Also emit a local REST server (server/server.py) and keep model data there'
+    )
+
+    parser.add_argument(
+        '--storage-worker',
+        action='store_true',
+        help='Keep model data in IndexedDB through a Web Worker instead of localStorage'
+    )
+
+    parser.add_argument(
+        '--sync-tabs',
+        action='store_true',
+        help='Keep open tabs of the app in sync by broadcasting each change'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help='Reuse parsed imports and rendered files from this directory across runs'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print per-template render time, output size and call counts'
+    )
+    
+    parser.add_argument(
+        '--profile-blocks',
+        action='store_true',
+        help='Also time the profiled blocks inside each template (implies --profile)'
+    )
+
     args = parser.parse_args(argv)
 
     try:
@@ -44,17 +118,19 @@ def main(argv=None):
         if not input_path.suffix == '.seed':
             print(f"Warning: Input file does not have .seed extension: {args.input}")
 
-        # Read input file
+        # Parse spec (imports resolve relative to the input file)
         if args.verbose:
             print(f"Reading input file: {args.input}")
-        with open(input_path) as f:
-            seed_content = f.read()
-
-        # Parse spec
-        if args.verbose:
             print("Parsing SeedSpec file...")
-        parser = SeedParser()
-        spec = parser.parse(seed_content)
+        module_cache = ModuleCache(cache_dir=os.path.join(args.cache_dir, 'modules') if args.cache_dir else None)
+        parser = SeedParser(module_cache=module_cache)
+        spec = parser.parse_file(str(input_path))
+        
+        # Resolve references once; the generator consumes the frozen IR
+        if args.verbose:
+            print("Analyzing spec...")
+        theme_resolver = ThemeResolver(cache_dir=os.path.join(args.cache_dir, 'themes') if args.cache_dir else None)
+        spec = Analyzer(theme_resolver).analyze(spec)
         
         if args.verbose:
             print("Parsed spec:")
@@ -67,8 +143,30 @@ def main(argv=None):
             print(f"Generating React app in: {output_path}")
         
         # Generate React app
-        generator = Generator()
-        generator.generate(spec, str(output_path))
+        profiler = None
+        if args.profile or args.profile_blocks:
+            profiler = TemplateProfiler(blocks=args.profile_blocks)
+        try:
+            generator = Generator(
+                lazy_routes=args.lazy_routes,
+                prefetch=args.prefetch,
+                static_css=args.static_css,
+                shared_components=args.shared_components,
+                data_chunk_size=args.data_chunk_size,
+                backend=args.backend,
+                storage_worker=args.storage_worker,
+                sync_tabs=args.sync_tabs,
+                profiler=profiler,
+                cache_dir=args.cache_dir
+            )
+            generator.generate(spec, str(output_path))
+        finally:
+            # Seed records wait in temporary files until the app is written
+            release_data(spec)
+        
+        if profiler is not None:
+            print()
+            print(profiler.report())
 
         # Print success message
         print("\nSuccessfully generated React app!")
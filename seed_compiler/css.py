@@ -0,0 +1,288 @@
+import re
+
+# className attributes and shared class constants (e.g. INPUT_CLASS = "...")
+CLASS_ATTRIBUTE = re.compile(r'(?:className=|[A-Z_]+_CLASS\s*=\s*)(?:"([^"]*)"|\{([^}]*)\})')
+CLASS_ATTRIBUTE_START = re.compile(r'className=|[A-Z_]+_CLASS\s*=\s*')
+STRING_LITERAL = re.compile(r'"([^"]*)"|\'([^\']*)\'|`([^`]*)`')
+TEMPLATE_EXPRESSION = re.compile(r'\{\{.*?\}\}|\{%.*?%\}|\$\{[^}]*\}')
+
+BREAKPOINTS = {'sm': '640px', 'md': '768px', 'lg': '1024px', 'xl': '1280px'}
+PSEUDO_CLASSES = {'hover': ':hover', 'focus': ':focus', 'disabled': ':disabled'}
+
+COLORS = {
+    'white': '#ffffff',
+    'black': '#000000',
+    'transparent': 'transparent',
+    'gray': ['#f9fafb', '#f3f4f6', '#e5e7eb', '#d1d5db', '#9ca3af', '#6b7280', '#4b5563', '#374151', '#1f2937', '#111827'],
+    'red': ['#fef2f2', '#fee2e2', '#fecaca', '#fca5a5', '#f87171', '#ef4444', '#dc2626', '#b91c1c', '#991b1b', '#7f1d1d'],
+    'yellow': ['#fefce8', '#fef9c3', '#fef08a', '#fde047', '#facc15', '#eab308', '#ca8a04', '#a16207', '#854d0e', '#713f12'],
+    'green': ['#f0fdf4', '#dcfce7', '#bbf7d0', '#86efac', '#4ade80', '#22c55e', '#16a34a', '#15803d', '#166534', '#14532d'],
+    'blue': ['#eff6ff', '#dbeafe', '#bfdbfe', '#93c5fd', '#60a5fa', '#3b82f6', '#2563eb', '#1d4ed8', '#1e40af', '#1e3a8a'],
+    'indigo': ['#eef2ff', '#e0e7ff', '#c7d2fe', '#a5b4fc', '#818cf8', '#6366f1', '#4f46e5', '#4338ca', '#3730a3', '#312e81'],
+}
+SHADES = ['50', '100', '200', '300', '400', '500', '600', '700', '800', '900']
+
+SPACING_PROPERTIES = {
+    'p': ['padding'],
+    'px': ['padding-left', 'padding-right'],
+    'py': ['padding-top', 'padding-bottom'],
+    'pt': ['padding-top'],
+    'pr': ['padding-right'],
+    'pb': ['padding-bottom'],
+    'pl': ['padding-left'],
+    'm': ['margin'],
+    'mx': ['margin-left', 'margin-right'],
+    'my': ['margin-top', 'margin-bottom'],
+    'mt': ['margin-top'],
+    'mr': ['margin-right'],
+    'mb': ['margin-bottom'],
+    'ml': ['margin-left'],
+    'gap': ['gap'],
+    'w': ['width'],
+    'h': ['height'],
+}
+
+STATIC_UTILITIES = {
+    'block': 'display: block',
+    'inline-block': 'display: inline-block',
+    'inline-flex': 'display: inline-flex',
+    'flex': 'display: flex',
+    'grid': 'display: grid',
+    'hidden': 'display: none',
+    'flex-1': 'flex: 1 1 0%',
+    'flex-col': 'flex-direction: column',
+    'flex-wrap': 'flex-wrap: wrap',
+    'flex-shrink-0': 'flex-shrink: 0',
+    'items-start': 'align-items: flex-start',
+    'items-center': 'align-items: center',
+    'items-end': 'align-items: flex-end',
+    'justify-start': 'justify-content: flex-start',
+    'justify-center': 'justify-content: center',
+    'justify-between': 'justify-content: space-between',
+    'justify-end': 'justify-content: flex-end',
+    'mx-auto': 'margin-left: auto; margin-right: auto',
+    'w-full': 'width: 100%',
+    'w-auto': 'width: auto',
+    'h-full': 'height: 100%',
+    'min-h-screen': 'min-height: 100vh',
+    'max-w-7xl': 'max-width: 80rem',
+    'overflow-hidden': 'overflow: hidden',
+    'text-left': 'text-align: left',
+    'text-center': 'text-align: center',
+    'text-right': 'text-align: right',
+    'text-xs': 'font-size: 0.75rem; line-height: 1rem',
+    'text-sm': 'font-size: 0.875rem; line-height: 1.25rem',
+    'text-base': 'font-size: 1rem; line-height: 1.5rem',
+    'text-lg': 'font-size: 1.125rem; line-height: 1.75rem',
+    'text-xl': 'font-size: 1.25rem; line-height: 1.75rem',
+    'text-2xl': 'font-size: 1.5rem; line-height: 2rem',
+    'text-3xl': 'font-size: 1.875rem; line-height: 2.25rem',
+    'font-sans': 'font-family: ui-sans-serif, system-ui, -apple-system, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif',
+    'font-serif': 'font-family: ui-serif, Georgia, Cambria, "Times New Roman", Times, serif',
+    'font-mono': 'font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace',
+    'font-normal': 'font-weight: 400',
+    'font-medium': 'font-weight: 500',
+    'font-semibold': 'font-weight: 600',
+    'font-bold': 'font-weight: 700',
+    'border': 'border-width: 1px',
+    'border-0': 'border-width: 0px',
+    'border-2': 'border-width: 2px',
+    'border-b': 'border-bottom-width: 1px',
+    'border-b-2': 'border-bottom-width: 2px',
+    'border-t': 'border-top-width: 1px',
+    'rounded': 'border-radius: 0.25rem',
+    'rounded-md': 'border-radius: 0.375rem',
+    'rounded-lg': 'border-radius: 0.5rem',
+    'rounded-full': 'border-radius: 9999px',
+    'shadow-sm': 'box-shadow: 0 1px 2px 0 rgb(0 0 0 / 0.05)',
+    'shadow': 'box-shadow: 0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+    'shadow-md': 'box-shadow: 0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+    'shadow-lg': 'box-shadow: 0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+    'outline-none': 'outline: 2px solid transparent; outline-offset: 2px',
+    'opacity-50': 'opacity: 0.5',
+    'cursor-pointer': 'cursor: pointer',
+    'cursor-not-allowed': 'cursor: not-allowed',
+    'underline': 'text-decoration-line: underline',
+}
+
+# Roughly Tailwind's preflight and @tailwindcss/forms defaults the generated markup relies on
+BASE_CSS = '''
+*, ::before, ::after { box-sizing: border-box; border-width: 0; border-style: solid; border-color: #e5e7eb; }
+html { line-height: 1.5; -webkit-text-size-adjust: 100%; font-family: ui-sans-serif, system-ui, -apple-system, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif; }
+body { margin: 0; line-height: inherit; }
+h1, h2, h3, h4, p, ul, ol { margin: 0; padding: 0; }
+h1, h2, h3, h4 { font-size: inherit; font-weight: inherit; }
+ul, ol { list-style: none; }
+a { color: inherit; text-decoration: inherit; }
+button, input, select, textarea { font-family: inherit; font-size: 100%; line-height: inherit; color: inherit; margin: 0; padding: 0; }
+button { background-color: transparent; background-image: none; cursor: pointer; }
+button:disabled { cursor: default; }
+[type='text'], [type='email'], [type='number'], [type='date'], select, textarea { appearance: none; background-color: #fff; border-color: #6b7280; border-width: 1px; border-radius: 0; padding: 0.5rem 0.75rem; font-size: 1rem; line-height: 1.5rem; }
+[type='checkbox'] { width: 1rem; height: 1rem; }
+'''.strip()
+
+def _spacing(value: str):
+    if value == 'px':
+        return '1px'
+    if value == '0':
+        return '0px'
+    try:
+        amount = float(value)
+    except ValueError:
+        return None
+    return f"{amount / 4:g}rem"
+
+def _color(name: str, theme=None):
+    if theme and name in theme.get('colors', {}):
+        return f"var(--color-{name})"
+    if name in COLORS and isinstance(COLORS[name], str):
+        return COLORS[name]
+    palette, _, shade = name.rpartition('-')
+    if isinstance(COLORS.get(palette), list) and shade in SHADES:
+        return COLORS[palette][SHADES.index(shade)]
+    return None
+
+def utility_rule(utility: str, theme=None):
+    """Return (selector suffix, declarations) for a utility class, or None if unknown
+
+    theme optionally adds theme color names ({'colors': {name: hex}}, used
+    through --color-<name> variables) and font families ({'fonts': {name: css}}).
+    """
+    if utility in STATIC_UTILITIES:
+        return '', STATIC_UTILITIES[utility]
+
+    prefix, _, value = utility.partition('-')
+    if prefix in ('space',) and value[:2] in ('x-', 'y-'):
+        amount = _spacing(value[2:])
+        if amount is None:
+            return None
+        side = 'margin-left' if value[0] == 'x' else 'margin-top'
+        return ' > :not([hidden]) ~ :not([hidden])', f"{side}: {amount}"
+    if prefix == 'grid' and value.startswith('cols-') and value[5:].isdigit():
+        return '', f"grid-template-columns: repeat({value[5:]}, minmax(0, 1fr))"
+    if prefix == 'ring':
+        if value.isdigit():
+            return '', (
+                "box-shadow: 0 0 0 var(--tw-ring-offset-width, 0px) #fff, "
+                f"0 0 0 calc({value}px + var(--tw-ring-offset-width, 0px)) var(--tw-ring-color, rgb(59 130 246 / 0.5))"
+            )
+        if value.startswith('offset-') and value[7:].isdigit():
+            return '', f"--tw-ring-offset-width: {value[7:]}px"
+        color = _color(value, theme)
+        return ('', f"--tw-ring-color: {color}") if color else None
+    if prefix == 'font' and theme and value in theme.get('fonts', {}):
+        return '', f"font-family: {theme['fonts'][value]}"
+    if prefix in ('bg', 'text', 'border'):
+        color = _color(value, theme)
+        if color is None:
+            return None
+        css_property = {'bg': 'background-color', 'text': 'color', 'border': 'border-color'}[prefix]
+        return '', f"{css_property}: {color}"
+    if prefix in SPACING_PROPERTIES:
+        amount = _spacing(value)
+        if amount is None:
+            return None
+        return '', '; '.join(f"{css_property}: {amount}" for css_property in SPACING_PROPERTIES[prefix])
+    return None
+
+def escape_class(name: str) -> str:
+    """Escape a class name for use in a CSS selector"""
+    return re.sub(r'([^a-zA-Z0-9_-])', r'\\\1', name)
+
+def collect_classes(source: str) -> set:
+    """Collect the class names used in className attributes and *_CLASS constants of JSX (or a JSX template)"""
+    classes = set()
+    for static, expression in CLASS_ATTRIBUTE.findall(source):
+        values = [static] if static else [''.join(match) for match in STRING_LITERAL.findall(expression)]
+        for value in values:
+            classes.update(TEMPLATE_EXPRESSION.sub(' ', value).split())
+    return classes
+
+def map_classes(source: str, mapping: dict) -> str:
+    """Replace class names in className attributes and *_CLASS constants (mapping values may hold several classes)"""
+    def map_literal(match):
+        return re.sub(r'[^\s"\'`]+', lambda name: mapping.get(name.group(0), name.group(0)), match.group(0))
+
+    def map_attribute(match):
+        return STRING_LITERAL.sub(map_literal, match.group(0))
+
+    return CLASS_ATTRIBUTE.sub(map_attribute, source)
+
+def map_classes_stream(chunks, mapping: dict):
+    """map_classes for text arriving in pieces, yielding mapped pieces
+
+    Each piece is mapped up to its last line break, or to the start of a
+    class attribute that is not closed yet, whichever comes first; the rest
+    waits for the next piece, so attributes split across pieces (or lines)
+    map exactly as in the whole text.
+    """
+    rest = ''
+    for chunk in chunks:
+        text = rest + chunk
+        cut = text.rfind('\n') + 1
+        position = 0
+        while True:
+            start = CLASS_ATTRIBUTE_START.search(text, position, cut)
+            if start is None:
+                break
+            attribute = CLASS_ATTRIBUTE.match(text, start.start())
+            if attribute is not None and attribute.end() <= cut:
+                position = attribute.end()
+                continue
+            value = CLASS_ATTRIBUTE_START.match(text, start.start()).end()
+            if attribute is None and value < len(text) and text[value] not in '"{':
+                position = start.end()  # Not a class attribute (e.g. className=variable)
+                continue
+            cut = start.start()
+            break
+        rest = text[cut:]
+        if cut:
+            yield map_classes(text[:cut], mapping)
+    if rest:
+        yield map_classes(rest, mapping)
+
+def build_stylesheet(classes, theme=None) -> str:
+    """Compile class names into a static stylesheet (unknown classes are skipped)
+
+    With a theme, its colors are declared as :root variables and can be used
+    by name (bg-primary, text-heading, ...).
+    """
+    plain, pseudo, media = [], [], {breakpoint: [] for breakpoint in BREAKPOINTS}
+    for name in sorted(classes):
+        *variants, utility = name.split(':')
+        rule = utility_rule(utility, theme)
+        if rule is None or len(variants) > 2:
+            continue
+        suffix, declarations = rule
+
+        breakpoint = None
+        pseudo_class = ''
+        for variant in variants:
+            if variant in BREAKPOINTS and breakpoint is None:
+                breakpoint = variant
+            elif variant in PSEUDO_CLASSES and not pseudo_class:
+                pseudo_class = PSEUDO_CLASSES[variant]
+            else:
+                rule = None
+        if rule is None:
+            continue
+
+        css = f".{escape_class(name)}{pseudo_class}{suffix} {{ {declarations}; }}"
+        if breakpoint:
+            media[breakpoint].append(css)
+        elif pseudo_class:
+            pseudo.append(css)
+        else:
+            plain.append(css)
+
+    lines = [BASE_CSS, '']
+    if theme and theme.get('colors'):
+        variables = ' '.join(f"--color-{name}: {value};" for name, value in theme['colors'].items())
+        lines += [f":root {{ {variables} }}", '']
+    lines += plain + pseudo
+    for breakpoint, rules in media.items():
+        if rules:
+            lines.append(f"@media (min-width: {BREAKPOINTS[breakpoint]}) {{")
+            lines.extend(f"  {css}" for css in rules)
+            lines.append('}')
+    return '\n'.join(lines)
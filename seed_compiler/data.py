@@ -0,0 +1,206 @@
+import os
+import re
+import json
+import atexit
+import hashlib
+import tempfile
+from .field_types import FIELD_TYPES
+
+# Tokens of a record list: strings, comments, punctuation and bare values (numbers, dates, ids, true/false)
+RECORD_TOKEN = re.compile(r'\s*(?:("(?:[^"\\]|\\.)*")|(//.*)|([{}:,\]])|([^\s{}:,\]"]+))')
+
+class DataError(Exception):
+    """Error for malformed seed data records"""
+
+# Record files that have not been released yet, removed at exit at the latest
+_record_files = set()
+
+class DataSet:
+    """Writer for the seed records of one `Name: Model[] [...]` entry of a data block
+
+    Records are appended to a temporary file as JSON lines while the spec is
+    parsed, so memory use does not grow with the number of records. finish()
+    closes the file and returns the plain descriptor kept in the spec: name,
+    model, line_num, count, sha256 and the records file's path.
+    """
+
+    def __init__(self, name: str, model: str, line_num=None):
+        self.name = name
+        self.model = model
+        self.line_num = line_num
+        self.count = 0
+        self._hash = hashlib.sha256()
+        self._file = tempfile.NamedTemporaryFile(prefix='seed-data-', suffix='.jsonl', delete=False)
+        _record_files.add(self._file.name)
+
+    def append(self, record: dict):
+        line = json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n'
+        self._file.write(line)
+        self._hash.update(line)
+        self.count += 1
+
+    def discard(self):
+        """Close and delete the records file, finished or not"""
+        self._file.close()
+        _remove(self._file.name)
+
+    def finish(self) -> dict:
+        self._file.close()
+        return {
+            'name': self.name,
+            'model': self.model,
+            'line_num': self.line_num,
+            'count': self.count,
+            'sha256': self._hash.hexdigest(),
+            'path': self._file.name
+        }
+
+def read_records(data_set):
+    """Yield the records of a data set descriptor, through a reader of its own"""
+    with open(data_set['path'], 'rb') as f:
+        for line in f:
+            yield json.loads(line)
+
+def record_chunks(data_set, size: int):
+    """Yield the records of a data set descriptor in lists of at most size records"""
+    chunk = []
+    for record in read_records(data_set):
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def release_data(spec):
+    """Delete the record files of a spec's (or IR's) data sets once they are no longer read"""
+    for data_set in spec.get('data') or ():
+        _remove(data_set['path'])
+
+def _remove(path: str):
+    _record_files.discard(path)
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+@atexit.register
+def _remove_unreleased():
+    for path in list(_record_files):
+        _remove(path)
+
+class RecordReader:
+    """Incrementally reads `{ key: value, ... }` records, one source line at a time
+
+    feed() returns the records completed by a line; records may span lines.
+    Values are kept as strings (quoted strings are unescaped) and converted
+    to their field types later. finished is set once the closing ']' of the
+    record list has been read.
+    """
+
+    def __init__(self):
+        self.finished = False
+        self._record = None
+        self._key = None
+        self._expect = 'record'  # record, key, colon, value, separator, next
+
+    def feed(self, line: str) -> list:
+        records = []
+        position = 0
+        line = line.rstrip()
+        while position < len(line):
+            match = RECORD_TOKEN.match(line, position)
+            if not match:
+                if line[position:].lstrip().startswith('"'):
+                    raise DataError("Unterminated string in data record")
+                raise DataError(f"Unexpected character in data record: {line[position:].lstrip()[:1]!r}")
+            position = match.end()
+            string, comment, punctuation, bare = match.groups()
+            if comment is not None:
+                break
+            if self.finished:
+                raise DataError("Unexpected content after the end of the record list")
+            record = self._token(string, punctuation, bare)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def _token(self, string, punctuation, bare):
+        expect = self._expect
+        if expect in ('record', 'next'):
+            if punctuation == '{':
+                self._record = {}
+                self._expect = 'key'
+            elif punctuation == ']' and (expect == 'next' or self._record is None):
+                self.finished = True
+            elif punctuation == ',' and expect == 'next':
+                self._expect = 'record'
+            else:
+                raise DataError("Expected '{' to start a record or ']' to end the list")
+        elif expect == 'key':
+            if punctuation == '}':
+                return self._end_record()
+            name = bare if bare is not None else (json.loads(string) if string is not None else None)
+            if name is None or not name.isidentifier():
+                raise DataError("Expected a field name in data record")
+            if name in self._record:
+                raise DataError(f"Duplicate field in data record: {name}")
+            self._key = name
+            self._expect = 'colon'
+        elif expect == 'colon':
+            if punctuation != ':':
+                raise DataError(f"Expected ':' after field name '{self._key}'")
+            self._expect = 'value'
+        elif expect == 'value':
+            if string is not None:
+                value = json.loads(string)
+            elif bare is not None:
+                value = bare
+            else:
+                raise DataError(f"Expected a value for field '{self._key}'")
+            self._record[self._key] = value
+            self._expect = 'separator'
+        elif expect == 'separator':
+            if punctuation == ',':
+                self._expect = 'key'
+            elif punctuation == '}':
+                return self._end_record()
+            else:
+                raise DataError("Expected ',' or '}' after a field value")
+        return None
+
+    def _end_record(self) -> dict:
+        record = self._record
+        self._record = None
+        self._expect = 'next'
+        return record
+
+def convert_record(record: dict, fields: dict, data_name: str, number: int) -> dict:
+    """Validate one record against its model's fields (by name) and convert it to JSON values
+
+    Records without an id get a stable one from the data set name and record
+    number; fields with defaults that the record leaves out get the default.
+    """
+    converted = {'id': str(record['id']) if 'id' in record else f"{data_name}-{number}"}
+    for name, value in record.items():
+        if name == 'id':
+            continue
+        field = fields.get(name)
+        if field is None:
+            raise DataError(f"Record {number} of '{data_name}' has unknown field '{name}'")
+        converted[name] = _field_value(field, value, data_name, number)
+    for name, field in fields.items():
+        if name not in converted and field.get('default') is not None:
+            converted[name] = _field_value(field, field['default'], data_name, number)
+    return converted
+
+def _field_value(field, value: str, data_name: str, number: int):
+    descriptor = FIELD_TYPES.get(field['type'])
+    if descriptor is None:
+        return value  # Reference fields hold the id of the referenced record
+    normalized = descriptor.validate_default(value)
+    if normalized is None:
+        raise DataError(
+            f"Record {number} of '{data_name}' has invalid {field['type']} value for '{field['name']}': {value}"
+        )
+    return descriptor.json_value(normalized)
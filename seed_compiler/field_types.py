@@ -0,0 +1,78 @@
+import re
+
+NUM_PATTERN = re.compile(r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?')
+DATE_PATTERN = re.compile(r'\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])')
+BOOL_LITERALS = {'true': 'true', 'false': 'false', 'True': 'true', 'False': 'false', 'TRUE': 'true', 'FALSE': 'false'}
+
+def js_string(value: str) -> str:
+    """Quote a default value as a single-quoted JS string"""
+    escaped = value.replace('\\', '\\\\').replace("'", "\\'")
+    return f"'{escaped}'"
+
+def _any_default(value: str):
+    return value
+
+def _bool_default(value: str):
+    literal = BOOL_LITERALS.get(value)
+    if literal is None:
+        literal = BOOL_LITERALS.get(value.lower())
+    return literal
+
+def _num_default(value: str):
+    return value if NUM_PATTERN.fullmatch(value) else None
+
+def _date_default(value: str):
+    return value if DATE_PATTERN.fullmatch(value) else None
+
+def _literal(value: str) -> str:
+    return value
+
+def _bool_literal(value: str) -> str:
+    return _bool_default(value) or 'false'
+
+def _num_json(value: str):
+    return int(value) if re.fullmatch(r'[+-]?\d+', value) else float(value)
+
+def _bool_json(value: str) -> bool:
+    return value == 'true'
+
+class TypeDescriptor:
+    """Everything the compiler needs to know about one built-in field type
+
+    - input_type: HTML input type used in generated forms
+    - input_attrs: extra input attributes (validation hints) for the form field
+    - validate_default: returns the normalized default, or None when invalid
+    - js_default: emits a normalized default as a JS literal
+    - json_value: converts a normalized value (e.g. from seed data) to a JSON value
+    - sql_type: SQLite column type used by the generated backend
+    """
+
+    def __init__(self, name, input_type, validate_default=_any_default, js_default=js_string, input_attrs='',
+                 json_value=_literal, sql_type='TEXT'):
+        self.name = name
+        self.input_type = input_type
+        self.validate_default = validate_default
+        self.js_default = js_default
+        self.input_attrs = input_attrs
+        self.json_value = json_value
+        self.sql_type = sql_type
+
+FIELD_TYPES = {}
+
+def register_type(descriptor: TypeDescriptor) -> TypeDescriptor:
+    """Add (or replace) a built-in field type"""
+    FIELD_TYPES[descriptor.name] = descriptor
+    return descriptor
+
+register_type(TypeDescriptor('text', 'text'))
+register_type(TypeDescriptor(
+    'num', 'number', _num_default, _literal,
+    input_attrs='min="-9007199254740991" max="9007199254740991" step="any"',
+    json_value=_num_json, sql_type='NUMERIC'
+))
+register_type(TypeDescriptor('bool', 'checkbox', _bool_default, _bool_literal, json_value=_bool_json, sql_type='INTEGER'))
+register_type(TypeDescriptor(
+    'email', 'email',
+    input_attrs='pattern="[a-z0-9._%+-]+@[a-z0-9.-]+\\.[a-z]{2,}$"'
+))
+register_type(TypeDescriptor('date', 'date', _date_default))
@@ -1,104 +1,516 @@
 import os
+import re
 import json
+import asyncio
+import time
+import hashlib
+import threading
 from jinja2 import Environment, FileSystemLoader
+from .analyzer import Analyzer
+from .profiler import ProfileExtension
+from .cache import RenderCache, shared_render_cache, context_hash
+from .field_types import FIELD_TYPES, NUM_PATTERN, js_string
+from .css import collect_classes, build_stylesheet, map_classes, map_classes_stream
+from .themes import ThemeResolver
+from .data import convert_record, record_chunks
+
+MANIFEST_FILE = 'seed-manifest.json'
+
+# Components emitted once into src/components when shared_components is set
+SHARED_COMPONENTS = ['ReferenceSelect', 'FormField', 'ItemRow']
+
+# Template classes swapped for theme colors in themed apps: class -> (themed class, color it needs)
+THEME_CLASSES = {
+    'bg-indigo-600': ('bg-primary', 'primary'),
+    'text-indigo-600': ('text-primary', 'primary'),
+    'hover:bg-indigo-700': ('hover:bg-hover', 'hover'),
+    'focus:ring-indigo-500': ('focus:ring-focus', 'focus'),
+    'focus:border-indigo-500': ('focus:border-inputFocus', 'inputFocus'),
+    'bg-red-600': ('bg-error', 'error'),
+    'text-red-700': ('text-error', 'error'),
+    'text-white': ('text-buttonText', 'buttonText'),
+    'text-gray-900': ('text-heading', 'heading'),
+    'text-gray-800': ('text-heading', 'heading'),
+    'text-gray-700': ('text-body', 'body'),
+    'text-gray-500': ('text-caption', 'caption'),
+    'bg-gray-100': ('bg-background', 'background'),
+    'bg-gray-50': ('bg-background', 'background'),
+    'hover:bg-gray-50': ('hover:bg-selected', 'selected'),
+    'bg-white': ('bg-card', 'card'),
+    'border-gray-300': ('border-border', 'border'),
+    'border-gray-200': ('border-divider', 'divider'),
+}
+
+# Classes that also get a theme font: class -> typography.fonts entry
+THEME_FONT_CLASSES = {
+    'min-h-screen': 'body',
+    'text-2xl': 'heading',
+    'text-xl': 'heading',
+    'text-lg': 'heading',
+}
+
+# Backends the generator can emit next to the React app (None keeps data in localStorage)
+BACKENDS = ('sqlite',)
+
+# Records per request when model hooks page through the backend
+API_PAGE_SIZE = 100
+
+# Rendered text is gathered into pieces of about this many characters per
+# write, so no output file is ever held in memory as a whole
+STREAM_BUFFER_SIZE = 64 * 1024
+
+# Renders longer than this many characters are streamed but not cached
+STREAM_CACHE_LIMIT = 1 << 20
+
+# Items per message when the storage worker streams a stored collection
+WORKER_LOAD_CHUNK_SIZE = 1000
+
+# Font names Tailwind (and the static stylesheet) know; others become font-<slot> families
+GENERIC_FONTS = ('sans', 'serif', 'mono')
 
 class Generator:
-    def __init__(self, template_dir='templates'):
+    def __init__(self, template_dir='templates', lazy_routes=False, prefetch=False, profiler=None,
+                 render_cache=False, cache_dir=None, static_css=False, shared_components=False,
+                 data_chunk_size=1000, backend=None, storage_worker=False,
+                 sync_tabs=False):
         self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), template_dir))
+            loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), template_dir)),
+            extensions=[ProfileExtension]
         )
         
+        # Optional TemplateProfiler recording per-template (and per-block) cost
+        self.profiler = profiler
+        self.env.profiler = profiler
+        
         # Add custom filters
         self.env.filters['lower'] = str.lower
         self.env.filters['input_type'] = self._input_type_for_field
+        self.env.filters['input_attrs'] = self._input_attrs_for_field
+        self.env.filters['input_props'] = self._input_props_for_field
         self.env.filters['default_value_for_field'] = self._default_value_for_field
+        self.env.filters['sql_type'] = self._sql_type_for_field
+        self.env.filters['py_defaults'] = self._py_defaults_for_fields
         
         # Define valid types
-        self.valid_types = {'text', 'num', 'bool', 'email'}
+        self.valid_types = FIELD_TYPES
+        
+        # Rendered output cache: True shares one cache per process (and
+        # cache_dir), or pass a RenderCache. Everything a template reads must
+        # come from its context so cache keys stay complete.
+        if render_cache is True or (not render_cache and cache_dir):
+            render_cache = shared_render_cache(cache_dir)
+        self.render_cache = render_cache or None
+        self._source_hashes = {}
+        
+        # Resolves cross-references (and theme inheritance) once per spec
+        # before rendering; resolved themes are kept on disk under cache_dir
+        theme_cache_dir = os.path.join(cache_dir, 'themes') if cache_dir else None
+        self.analyzer = Analyzer(ThemeResolver(cache_dir=theme_cache_dir))
+        
+        # Code splitting options for App.js; only lazy screens can be prefetched
+        if prefetch and not lazy_routes:
+            raise ValueError("prefetch requires lazy_routes")
+        self.lazy_routes = lazy_routes
+        self.prefetch = prefetch
+        
+        # Precompiled stylesheet instead of the Tailwind CDN runtime
+        self.static_css = static_css
+        self._stylesheets = {}
+        
+        # Screens use FormField/ItemRow from src/components instead of inlining markup
+        self.shared_components = shared_components
+        
+        # Seed data is written as JSON files of this many records under public/data
+        if data_chunk_size < 1:
+            raise ValueError("data_chunk_size must be at least 1")
+        self.data_chunk_size = data_chunk_size
+        
+        # 'sqlite' also emits server/server.py and model hooks that page through its REST API
+        if backend is not None and backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
+        
+        # Model hooks keep data in IndexedDB through a Web Worker instead of localStorage
+        if storage_worker and backend:
+            raise ValueError("storage_worker cannot be combined with a backend")
+        self.storage_worker = storage_worker
+        
+        # Model hooks broadcast per-change deltas so other tabs stay in step
+        self.sync_tabs = sync_tabs
         
     def generate(self, spec: dict, output_dir: str):
-        """Generate React app from parsed spec"""
-        # Create directories
+        """Generate React app from parsed spec or analyzed IR
+
+        Seed records stay in temporary files, so a spec can be generated more
+        than once; call release_data(spec) when it is no longer needed.
+        """
+        spec = self.analyzer.analyze(spec)
+        self._create_directories(output_dir, spec)
+        
+        files = {}
+        for output in self._outputs(spec):
+            written = self._write_output(output_dir, output['path'], self._output_chunks(output))
+            files[output['path']] = {**written, 'sources': output['sources']}
+        files.update(self._write_data(spec, output_dir))
+        self._write_manifest(spec, output_dir, files)
+
+    async def generate_async(self, spec: dict, output_dir: str, concurrency: int = 8, executor=None):
+        """Generate React app without blocking the event loop
+
+        Each file is rendered and streamed to disk as one job in the
+        executor, and at most `concurrency` of those jobs run at a time.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        loop = asyncio.get_running_loop()
+        spec = await loop.run_in_executor(executor, self.analyzer.analyze, spec)
+        await loop.run_in_executor(executor, self._create_directories, output_dir, spec)
+        
+        slots = asyncio.Semaphore(concurrency)
+        
+        files = {}
+        
+        async def write(output):
+            try:
+                chunks = self._output_chunks(output)
+                written = await loop.run_in_executor(executor, self._write_output, output_dir, output['path'], chunks)
+                files[output['path']] = {**written, 'sources': output['sources']}
+            finally:
+                slots.release()
+        
+        writes = []
+        try:
+            for output in self._outputs(spec):
+                await slots.acquire()
+                writes.append(asyncio.ensure_future(write(output)))
+        finally:
+            # Let started writes finish (or fail) before returning or raising
+            results = await asyncio.gather(*writes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        files.update(await loop.run_in_executor(executor, self._write_data, spec, output_dir))
+        await loop.run_in_executor(executor, self._write_manifest, spec, output_dir, files)
+
+    def _create_directories(self, output_dir: str, spec):
+        """Create the directory layout of the generated app"""
         os.makedirs(output_dir, exist_ok=True)
         os.makedirs(os.path.join(output_dir, 'src'), exist_ok=True)
         os.makedirs(os.path.join(output_dir, 'src/models'), exist_ok=True)
         os.makedirs(os.path.join(output_dir, 'src/screens'), exist_ok=True)
         os.makedirs(os.path.join(output_dir, 'src/components'), exist_ok=True)  # Add components directory
+        os.makedirs(os.path.join(output_dir, 'src/utils'), exist_ok=True)
         os.makedirs(os.path.join(output_dir, 'public'), exist_ok=True)  # Add public directory
-        
-        # Generate error boundary component
-        self._generate_file('ErrorBoundary.js.tmpl',
-                          os.path.join(output_dir, 'src/components/ErrorBoundary.js'),
-                          {})
+        if spec['theme']:
+            os.makedirs(os.path.join(output_dir, 'src/theme'), exist_ok=True)
+        if self.backend:
+            os.makedirs(os.path.join(output_dir, 'server'), exist_ok=True)
+        for data_set in spec['data']:
+            os.makedirs(os.path.join(output_dir, 'public/data', data_set['name']), exist_ok=True)
+
+    def _outputs(self, spec) -> list:
+        """List every generated file, either as a template render or fixed content
 
-        # Generate index.css with Tailwind directives
-        self._generate_index_css(output_dir)
+        'sources' names the spec nodes each file is generated from
+        ('app', 'theme', 'model:Name', 'screen:Name', 'data:Name'); static
+        files have none. Seed data files are written by _write_data.
+        Rendered JSX of themed apps has its classes mapped to theme colors
+        ('class_map').
+        """
+        theme = spec['theme']
+        class_map = self._theme_class_map(theme) if theme else None
+        theme_sources = ['theme'] if theme else []
         
-        # Generate Tailwind config files
-        self._generate_tailwind_config(output_dir)
-        self._generate_postcss_config(output_dir)
+        outputs = [
+            # Error boundary component
+            {'path': 'src/components/ErrorBoundary.js', 'template': 'ErrorBoundary.js.tmpl', 'context': {}},
+            # Id helpers shared by the model hooks
+            {'path': 'src/utils/id.js', 'template': 'id.js.tmpl', 'context': {}},
+            # index.css with Tailwind directives (or the precompiled stylesheet)
+            {
+                'path': 'src/index.css',
+                'content': self._static_css(theme, class_map) if self.static_css else self._index_css(theme),
+                'sources': theme_sources
+            },
+            # Tailwind config files
+            {'path': 'tailwind.config.js', 'content': self._tailwind_config(theme), 'sources': theme_sources},
+            {'path': 'postcss.config.js', 'content': self._postcss_config()},
+            {'path': 'public/index.html', 'content': self._index_html()},
+            {'path': 'src/index.js', 'content': self._index_js()},
+            {
+                'path': 'src/App.js',
+                'template': 'App.js.tmpl',
+                'context': {
+                    **{key: value for key, value in spec.items() if key != 'data'},
+                    'lazy_routes': self.lazy_routes,
+                    'prefetch': self.prefetch
+                },
+                'sources': ['app'] + theme_sources + [f"screen:{screen['name']}" for screen in spec['screens']],
+                'class_map': class_map
+            }
+        ]
+        
+        if theme:
+            outputs.append({'path': 'src/theme/theme.js', 'content': self._theme_js(spec), 'sources': ['theme']})
+            outputs.append({
+                'path': 'src/theme/ThemeProvider.js',
+                'template': 'ThemeProvider.js.tmpl',
+                'context': {},
+                'class_map': class_map
+            })
         
-        # Generate public/index.html
-        self._generate_index_html(output_dir)
+        # Inverted index helpers for models with searchable fields
+        if any(field.get('searchable') for model in spec['models'] for field in model['fields']):
+            outputs.append({'path': 'src/utils/search.js', 'template': 'search.js.tmpl', 'context': {}})
         
-        # Generate src/index.js
-        self._generate_index_js(output_dir)
+        if self.sync_tabs:
+            outputs.append({'path': 'src/utils/sync.js', 'template': 'sync.js.tmpl', 'context': {}})
         
-        # Generate App.js
-        self._generate_file('App.js.tmpl', 
-                          os.path.join(output_dir, 'src/App.js'),
-                          spec)
+        if self.storage_worker:
+            outputs.append({'path': 'src/utils/storage.js', 'template': 'storage.js.tmpl', 'context': {}})
+            outputs.append({
+                'path': 'src/utils/storage.worker.js',
+                'template': 'storage.worker.js.tmpl',
+                'context': {
+                    'db_name': spec['app']['name'] if spec.get('app') else 'seedspec',
+                    'chunk_size': WORKER_LOAD_CHUNK_SIZE,
+                    'stores': tuple(
+                        (f"{model['name'].lower()}s", tuple(field['name'] for field in model['fields'] if field.get('indexed')))
+                        for model in spec['models']
+                    )
+                },
+                'sources': ['app'] + [f"model:{model['name']}" for model in spec['models']]
+            })
+        
+        if self.backend:
+            # Screens sort on the server, so their sort fields are indexed there
+            sort_fields = sorted({f"{screen['model']['name']}.{screen['sort']['field']}"
+                                  for screen in spec['screens'] if screen.get('sort')})
+            outputs.append({'path': 'src/utils/api.js', 'template': 'api.js.tmpl', 'context': {}})
+            outputs.append({
+                'path': 'server/server.py',
+                'template': 'server.py.tmpl',
+                'context': {'models': spec['models'], 'sort_fields': sort_fields},
+                'sources': [f"model:{model['name']}" for model in spec['models']]
+                           + [f"data:{data_set['name']}" for data_set in spec['data']]
+                           + [f"screen:{screen['name']}" for screen in spec['screens'] if screen.get('sort')]
+            })
         
-        # Generate models
         for model in spec['models']:
-            self._generate_file('Model.js.tmpl',
-                              os.path.join(output_dir, f'src/models/{model["name"]}.js'),
-                              model)
+            if self.backend:
+                template, context = 'ModelApi.js.tmpl', {
+                    **model, 'api_page_size': API_PAGE_SIZE, 'sync_tabs': self.sync_tabs
+                }
+            else:
+                template, context = 'Model.js.tmpl', {
+                    **model, 'data_chunk_size': self.data_chunk_size, 'storage_worker': self.storage_worker,
+                    'sync_tabs': self.sync_tabs
+                }
+            outputs.append({
+                'path': f'src/models/{model["name"]}.js',
+                'template': template,
+                'context': context,
+                'sources': [f"model:{name}" for name in (model['name'],) + model['references']]
+                           + [f"data:{data_set['name']}" for data_set in model['data_sets']]
+            })
+        
+        if self.shared_components:
+            for component in SHARED_COMPONENTS:
+                outputs.append({
+                    'path': f'src/components/{component}.js',
+                    'template': f'{component}.js.tmpl',
+                    'context': {},
+                    'sources': theme_sources,
+                    'class_map': class_map
+                })
         
-        # Generate screens
+        # The IR carries each screen's resolved model
         for screen in spec['screens']:
-            # Find corresponding model
-            model = next(m for m in spec['models'] if m['name'] == screen['model'])
-            screen['model'] = model
-            
-            self._generate_file('Screen.js.tmpl',
-                              os.path.join(output_dir, f'src/screens/{screen["name"]}.js'),
-                              screen)
-                              
-        # Generate package.json
-        self._generate_package_json(output_dir)
-        
-    def _generate_file(self, template_name: str, output_path: str, context: dict):
-        """Generate a single file from template"""
-        # Add model references to context
-        if isinstance(context, dict) and 'fields' in context:
-            for field in context['fields']:
-                if field['type'] not in self.valid_types:
-                    field['is_reference'] = True
-        template = self.env.get_template(template_name)
-        with open(output_path, 'w') as f:
-            f.write(template.render(**context))
+            outputs.append({
+                'path': f'src/screens/{screen["name"]}.js',
+                'template': 'Screen.js.tmpl',
+                'context': {**screen, 'shared_components': self.shared_components, 'paged_store': bool(self.backend)},
+                'sources': [f"screen:{screen['name']}"] + [f"model:{name}" for name in screen['imports']] + theme_sources,
+                'class_map': class_map
+            })
+        
+        outputs.append({'path': 'package.json', 'content': self._package_json()})
+        for output in outputs:
+            output.setdefault('sources', [])
+        return outputs
+
+    def _output_content(self, output: dict) -> str:
+        """Produce the text of one output file"""
+        return ''.join(self._output_chunks(output))
+
+    def _output_chunks(self, output: dict):
+        """Produce the text of one output file as a stream of pieces"""
+        if 'template' not in output:
+            yield output['content']
+            return
+        chunks = self._render_chunks(output['template'], output['context'])
+        if output.get('class_map'):
+            chunks = map_classes_stream(chunks, output['class_map'])
+        yield from chunks
+
+    def _write_output(self, output_dir: str, path: str, content) -> dict:
+        """Write one output file below the output directory, returning its size and hash
+
+        content is a string or an iterable of strings, written as they come.
+        They go to a temporary file that replaces the output once complete,
+        so a render error never leaves a truncated file behind.
+        """
+        if isinstance(content, str):
+            content = (content,)
+        digest = hashlib.sha256()
+        size = 0
+        full_path = os.path.join(output_dir, path)
+        tmp_path = f"{full_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in content:
+                    data = chunk.encode('utf-8')
+                    f.write(data)
+                    digest.update(data)
+                    size += len(data)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return {'size': size, 'sha256': digest.hexdigest()}
+
+    def _write_manifest(self, spec, output_dir: str, files: dict):
+        """Write seed-manifest.json describing every generated file
+
+        Node hashes let tools see which spec nodes changed between runs, and
+        each file lists the nodes it came from, so only files whose sources
+        (or own hash) changed need to be invalidated.
+        """
+        nodes = {}
+        if spec.get('app'):
+            nodes['app'] = context_hash(spec['app'])
+        if spec['theme']:
+            nodes['theme'] = context_hash({'theme': spec['theme'], 'dark_theme': spec['dark_theme']})
+        for model in spec['models']:
+            nodes[f"model:{model['name']}"] = context_hash(model)
+        for screen in spec['screens']:
+            nodes[f"screen:{screen['name']}"] = context_hash(screen)
+        for data_set in spec['data']:
+            nodes[f"data:{data_set['name']}"] = data_set['sha256']
+        
+        manifest = {
+            'version': 1,
+            'nodes': nodes,
+            'files': {path: files[path] for path in sorted(files)}
+        }
+        self._write_output(output_dir, MANIFEST_FILE, json.dumps(manifest, indent=2))
+
+    def _write_data(self, spec, output_dir: str) -> dict:
+        """Write seed data as public/data/<Name>/<chunk>.json, one chunk in memory at a time"""
+        files = {}
+        models = spec['models']
+        for data_set in spec['data']:
+            model = models[spec['model_index'][data_set['model']]]
+            fields = {field['name']: field for field in model['fields']}
+            number = 0
+            for index, chunk in enumerate(record_chunks(data_set, self.data_chunk_size)):
+                records = []
+                for record in chunk:
+                    number += 1
+                    records.append(convert_record(record, fields, data_set['name'], number))
+                path = f"public/data/{data_set['name']}/{index}.json"
+                written = self._write_output(output_dir, path, json.dumps(records, separators=(',', ':')))
+                files[path] = {**written, 'sources': [f"data:{data_set['name']}"]}
+        return files
+
+    def _render(self, template_name: str, context: dict) -> str:
+        """Render a template, serving repeated renders from the render cache"""
+        return ''.join(self._render_chunks(template_name, context))
+
+    def _render_chunks(self, template_name: str, context: dict):
+        """Render a template as pieces of about STREAM_BUFFER_SIZE characters
+
+        Renders up to STREAM_CACHE_LIMIT characters go through the render
+        cache; longer ones are only streamed, so memory stays bounded.
+        """
+        key = None
+        if self.render_cache is not None:
+            key = RenderCache.make_key(template_name, self._source_hash(template_name), context)
+            content = self.render_cache.get(key)
+            if content is not None:
+                yield content
+                return
+        
+        events = self.env.get_template(template_name).generate(**context)
+        if self.profiler is not None:
+            events = self._profiled(template_name, events)
+        
+        cached = [] if key is not None else None
+        cached_size = 0
+        buffer = []
+        buffered = 0
+        for event in events:
+            buffer.append(event)
+            buffered += len(event)
+            if buffered < STREAM_BUFFER_SIZE:
+                continue
+            piece = ''.join(buffer)
+            buffer = []
+            buffered = 0
+            if cached is not None:
+                cached_size += len(piece)
+                if cached_size <= STREAM_CACHE_LIMIT:
+                    cached.append(piece)
+                else:
+                    cached = None
+            yield piece
+        piece = ''.join(buffer)
+        if cached is not None and cached_size + len(piece) <= STREAM_CACHE_LIMIT:
+            self.render_cache.put(key, ''.join(cached) + piece)
+        if piece:
+            yield piece
+
+    def _profiled(self, template_name: str, events):
+        """Pass rendered events through, recording the render time and size once done"""
+        seconds = 0.0
+        size = 0
+        while True:
+            start = time.perf_counter()
+            event = next(events, None)
+            seconds += time.perf_counter() - start
+            if event is None:
+                break
+            size += len(event)
+            yield event
+        self.profiler.record(template_name, seconds, size)
+
+    def _source_hash(self, template_name: str) -> str:
+        """Hash of a template's source, so edited templates miss the cache"""
+        if template_name not in self._source_hashes:
+            source, _, _ = self.env.loader.get_source(self.env, template_name)
+            self._source_hashes[template_name] = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        return self._source_hashes[template_name]
             
-    def _generate_index_html(self, output_dir: str):
+    def _index_html(self) -> str:
         """Generate index.html"""
-        html = '''
+        cdn_script = '' if self.static_css else '\n    <script src="https://cdn.tailwindcss.com"></script>'
+        html = f'''
 <!DOCTYPE html>
 <html lang="en">
   <head>
     <meta charset="utf-8" />
     <meta name="viewport" content="width=device-width, initial-scale=1" />
-    <title>SeedSpec App</title>
-    <script src="https://cdn.tailwindcss.com"></script>
+    <title>SeedSpec App</title>{cdn_script}
   </head>
   <body>
     <div id="root"></div>
   </body>
 </html>
 '''
-        with open(os.path.join(output_dir, 'public/index.html'), 'w') as f:
-            f.write(html.strip())
+        return html.strip()
 
-    def _generate_index_js(self, output_dir: str):
+    def _index_js(self) -> str:
         """Generate index.js"""
         js = '''
 import React from 'react';
@@ -113,10 +525,9 @@ ReactDOM.render(
   document.getElementById('root')
 );
 '''
-        with open(os.path.join(output_dir, 'src/index.js'), 'w') as f:
-            f.write(js.strip())
+        return js.strip()
 
-    def _generate_package_json(self, output_dir: str):
+    def _package_json(self) -> str:
         """Generate package.json with minimal required dependencies"""
         package = {
             "name": "seedspec-app",
@@ -148,33 +559,57 @@ ReactDOM.render(
             }
         }
         
-        with open(os.path.join(output_dir, 'package.json'), 'w') as f:
-            json.dump(package, f, indent=2)
+        if self.backend:
+            # The dev server forwards /api requests to server/server.py
+            package["scripts"]["server"] = "python3 server/server.py"
+            package["proxy"] = "http://localhost:8000"
+        
+        return json.dumps(package, indent=2)
             
     def _input_type_for_field(self, field_type: str) -> str:
         """Convert SeedSpec type to HTML input type"""
-        types = {
-            'text': 'text',
-            'num': 'number',
-            'bool': 'checkbox',
-            'email': 'email'
-        }
-        return types.get(field_type, 'text')
+        descriptor = FIELD_TYPES.get(field_type)
+        return descriptor.input_type if descriptor else 'text'
+
+    def _input_attrs_for_field(self, field_type: str) -> str:
+        """Extra HTML input attributes (validation hints) for a SeedSpec type"""
+        descriptor = FIELD_TYPES.get(field_type)
+        return descriptor.input_attrs if descriptor else ''
+
+    def _input_props_for_field(self, field_type: str) -> str:
+        """Extra HTML input attributes for a SeedSpec type as a JS object literal"""
+        props = dict(re.findall(r'([\w-]+)="([^"]*)"', self._input_attrs_for_field(field_type)))
+        return json.dumps(props)
 
     def _default_value_for_field(self, field: dict) -> str:
         """Convert field default value to appropriate JS value"""
         if not field.get('default'):
             return 'null'
-        if field['type'] == 'bool':
-            # Convert string 'true'/'false' to JavaScript boolean literal
-            return 'true' if field['default'].lower() == 'true' else 'false'
-        elif field['type'] == 'num':
-            return str(field['default'])
-        else:
-            return f"'{field['default']}'"  # Use single quotes for JS strings
-    def _generate_tailwind_config(self, output_dir: str):
-        """Generate tailwind.config.js"""
-        config = '''
+        descriptor = FIELD_TYPES.get(field['type'])
+        if descriptor is None:
+            return js_string(str(field['default']))
+        return descriptor.js_default(str(field['default']))
+
+    def _sql_type_for_field(self, field: dict) -> str:
+        """SQLite column type for a field; references hold the referenced id"""
+        descriptor = FIELD_TYPES.get(field['type'])
+        return descriptor.sql_type if descriptor else 'TEXT'
+
+    def _py_defaults_for_fields(self, fields) -> str:
+        """Python dict literal of the JSON default values of the fields that have one"""
+        defaults = {}
+        for field in fields:
+            if not field.get('default'):
+                continue
+            descriptor = FIELD_TYPES.get(field['type'])
+            value = str(field['default'])
+            defaults[field['name']] = descriptor.json_value(descriptor.validate_default(value)) if descriptor else value
+        return repr(defaults)
+
+    def _tailwind_config(self, theme=None) -> str:
+        """Generate tailwind.config.js (theme colors read the CSS variables set by ThemeProvider)"""
+        if not theme:
+            config = '''
 module.exports = {
   content: [
     "./src/**/*.{js,jsx,ts,tsx}",
@@ -187,10 +622,99 @@ module.exports = {
   ],
 }
 '''
-        with open(os.path.join(output_dir, 'tailwind.config.js'), 'w') as f:
-            f.write(config.strip())
+            return config.strip()
+        
+        typography = theme.get('typography', {})
+        extend = {
+            'colors': {name: f"var(--color-{name})" for name in theme['colors']},
+            'fontFamily': self._font_families(theme),
+            'fontWeight': dict(typography.get('weights', {})),
+            'lineHeight': dict(typography.get('lineHeights', {})),
+            'spacing': {name: self._css_length(value) for name, value in theme.get('spacing', {}).items()},
+            'borderRadius': {name: self._css_length(value) for name, value in theme.get('radii', {}).items()}
+        }
+        sections = ''.join(
+            f"      {key}: {self._js_value(values, 6)},\n" for key, values in extend.items() if values
+        )
+        config = f'''
+module.exports = {{
+  content: [
+    "./src/**/*.{{js,jsx,ts,tsx}}",
+  ],
+  darkMode: 'class',
+  theme: {{
+    extend: {{
+{sections}    }},
+  }},
+  plugins: [
+    require('@tailwindcss/forms'),
+  ],
+}}
+'''
+        return config.strip()
 
-    def _generate_postcss_config(self, output_dir: str):
+    def _theme_js(self, spec) -> str:
+        """Generate src/theme/theme.js with the resolved theme tokens"""
+        def theme_object(theme):
+            colors = ''.join(
+                f"    {self._js_key(name)}: '{value}', // {theme['color_sources'][name]}\n"
+                for name, value in theme['colors'].items()
+            )
+            lines = [f"{{\n  name: {js_string(theme['name'])},\n  colors: {{\n{colors}  }},\n"]
+            for section in ('typography', 'spacing', 'radii', 'metadata'):
+                lines.append(f"  {section}: {self._js_value(theme.get(section, {}), 2)},\n")
+            return ''.join(lines) + '}'
+        
+        theme = spec['theme']
+        dark_theme = theme_object(spec['dark_theme']) if spec['dark_theme'] else 'null'
+        extends = f" (extends {theme['extends']})" if theme.get('extends') else ''
+        return (
+            f"// Resolved from theme {theme['name']}{extends}; color comments name the source values\n"
+            f"export const theme = {theme_object(theme)};\n\n"
+            f"export const darkTheme = {dark_theme};\n"
+        )
+
+    def _theme_class_map(self, theme) -> dict:
+        """Map template classes to the theme's colors and fonts (only for colors the theme defines)"""
+        class_map = {
+            name: themed for name, (themed, color) in THEME_CLASSES.items() if color in theme['colors']
+        }
+        fonts = theme.get('typography', {}).get('fonts', {})
+        for name, slot in THEME_FONT_CLASSES.items():
+            if slot in fonts:
+                font = fonts[slot] if fonts[slot] in GENERIC_FONTS else slot
+                class_map[name] = f"{class_map.get(name, name)} font-{font}"
+        return class_map
+
+    def _font_families(self, theme) -> dict:
+        """CSS font stacks for theme fonts that are not one of Tailwind's generic families"""
+        fonts = theme.get('typography', {}).get('fonts', {})
+        return {slot: [font, 'sans-serif'] for slot, font in fonts.items() if font not in GENERIC_FONTS}
+
+    def _css_length(self, value: str) -> str:
+        """Theme sizes are in rem; 9999 (fully rounded) is in px; other units pass through"""
+        if not NUM_PATTERN.fullmatch(value):
+            return value
+        if float(value) == 0:
+            return '0'
+        return '9999px' if float(value) >= 9999 else f"{value}rem"
+
+    def _js_key(self, key: str) -> str:
+        return key if key.isidentifier() else json.dumps(key)
+
+    def _js_value(self, value, indent: int) -> str:
+        """Format a token table as a JS literal (numeric strings become numbers)"""
+        if isinstance(value, str):
+            return value if NUM_PATTERN.fullmatch(value) else js_string(value)
+        if isinstance(value, (list, tuple)):
+            return '[' + ', '.join(self._js_value(item, indent) for item in value) + ']'
+        if not value:
+            return '{}'
+        pad = ' ' * (indent + 2)
+        items = ''.join(f"{pad}{self._js_key(key)}: {self._js_value(item, indent + 2)},\n" for key, item in value.items())
+        return f"{{\n{items}{' ' * indent}}}"
+
+    def _postcss_config(self) -> str:
         """Generate postcss.config.js"""
         config = '''
 module.exports = {
@@ -200,15 +724,32 @@ module.exports = {
   },
 }
 '''
-        with open(os.path.join(output_dir, 'postcss.config.js'), 'w') as f:
-            f.write(config.strip())
+        return config.strip()
             
-    def _generate_index_css(self, output_dir: str):
-        """Generate index.css with Tailwind directives"""
+    def _static_css(self, theme=None, class_map=None) -> str:
+        """Build index.css from the utility classes used by the templates"""
+        key = context_hash({'theme': theme, 'class_map': class_map}) if theme else None
+        if key not in self._stylesheets:
+            classes = set()
+            for template_name in self.env.list_templates(extensions=['tmpl']):
+                source, _, _ = self.env.loader.get_source(self.env, template_name)
+                classes |= collect_classes(map_classes(source, class_map) if class_map else source)
+            css_theme = None
+            if theme:
+                fonts = {slot: ', '.join(json.dumps(font) if ' ' in font else font for font in family)
+                         for slot, family in self._font_families(theme).items()}
+                css_theme = {'colors': theme['colors'], 'fonts': fonts}
+            self._stylesheets[key] = build_stylesheet(classes, css_theme)
+        return self._stylesheets[key]
+
+    def _index_css(self, theme=None) -> str:
+        """Generate index.css with Tailwind directives (and the theme's color variables)"""
         css = '''
 @tailwind base;
 @tailwind components;
 @tailwind utilities;
 '''
-        with open(os.path.join(output_dir, 'src/index.css'), 'w') as f:
-            f.write(css.strip())
+        if theme:
+            variables = '\n'.join(f"    --color-{name}: {value};" for name, value in theme['colors'].items())
+            css += f"\n@layer base {{\n  :root {{\n{variables}\n  }}\n}}\n"
+        return css.strip()
@@ -0,0 +1,83 @@
+import os
+import hashlib
+import threading
+from . import serialize
+
+class ModuleCache:
+    """Parsed .seed modules keyed by path
+
+    An entry is reused while the file's mtime and size are unchanged; when
+    they change the content hash is compared before re-parsing, so touching
+    a file without editing it does not cost a parse. Loading the same path
+    from several threads parses it only once. With cache_dir set, parsed
+    modules are also stored there in the binary spec format, keyed by
+    content hash, and loaded instead of parsed in later processes.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self.parses = 0
+        self._entries = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str, parse_module) -> dict:
+        """Return the parsed module at path, calling parse_module(data, path) with the raw bytes on a miss"""
+        path = os.path.realpath(path)
+        with self._path_lock(path):
+            stat = os.stat(path)
+            entry = self._entries.get(path)
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                return entry['module']
+
+            with open(path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            if entry and entry['sha256'] == digest:
+                module = entry['module']
+            else:
+                module = self._read_disk(digest)
+                if module is None:
+                    module = parse_module(data, path)
+                    self.parses += 1
+                    self._write_disk(digest, module)
+
+            self._entries[path] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': digest,
+                'module': module
+            }
+            return module
+
+    def clear(self):
+        """Forget all parsed modules"""
+        with self._lock:
+            self._entries.clear()
+
+    def _disk_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.v{serialize.FORMAT_VERSION}.seedc")
+
+    def _read_disk(self, digest: str):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(digest), 'rb') as f:
+                return serialize.load(f)
+        except (OSError, serialize.SerializeError):
+            return None
+
+    def _write_disk(self, digest: str, module: dict):
+        if not self.cache_dir:
+            return
+        path = self._disk_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so concurrent readers never see partial entries
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            serialize.dump(module, f)
+        os.replace(tmp_path, path)
+
+    def _path_lock(self, path: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(path, threading.Lock())
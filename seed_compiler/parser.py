@@ -1,3 +1,50 @@
+import os
+import re
+import sys
+import copy
+import mmap
+from .modules import ModuleCache
+from .field_types import FIELD_TYPES
+from .stdlib import StdLibManager
+from .data import DataSet, DataError, RecordReader, release_data
+
+IMPORT_PATTERN = re.compile(r'import\s+(?:\{([^}]*)\}\s*from\s+)?"([^"]+)"')
+THEME_PATTERN = re.compile(r'theme\s+(\w+)(?:\s+"([^"]*)")?(?:\s+extends\s+(\w+))?\s*\{')
+THEME_ENTRY_PATTERN = re.compile(r'("[^"]+"|[A-Za-z_][\w-]*)\s*:\s*(.*)')
+THEME_SECTIONS = ('metadata', 'colors', 'typography', 'spacing', 'radii')
+DATA_SET_PATTERN = re.compile(r'(\w+)\s*:\s*(\w+)\[\]\s*\[(.*)')
+FIELD_MODIFIERS = ('indexed', 'searchable')
+SEARCHABLE_TYPES = ('text', 'email')
+
+def iter_lines(source):
+    """Yield the lines of a str or UTF-8 buffer, starting at the first non-blank line
+
+    Buffers (bytes, mmap) are decoded one line at a time instead of as a whole.
+    """
+    if isinstance(source, str):
+        lines = source.splitlines()
+    else:
+        lines = _iter_buffer_lines(source)
+    
+    started = False
+    for line in lines:
+        if not started:
+            if not line.strip():
+                continue
+            line = line.lstrip()
+            started = True
+        yield line
+
+def _iter_buffer_lines(buffer):
+    start = 0
+    end = len(buffer)
+    while start < end:
+        newline = buffer.find(b'\n', start)
+        if newline == -1:
+            newline = end
+        yield buffer[start:newline].rstrip(b'\r').decode('utf-8')
+        start = newline + 1
+
 class ParseError(Exception):
     """Custom error for parsing issues"""
     def __init__(self, message, line_num=None, line_content=None, prev_line=None, next_line=None):
@@ -10,49 +57,141 @@ class ParseError(Exception):
 class SeedParser:
     """Parses .seed files into Python data structures"""
     
-    def __init__(self):
-        self.valid_types = {'text', 'num', 'bool', 'email'}
+    def __init__(self, module_cache=None):
+        self.valid_types = FIELD_TYPES  # name -> TypeDescriptor
+        # Imported files are parsed once per cache; share a ModuleCache
+        # between parsers to reuse parsed libraries across builds
+        self.module_cache = module_cache if module_cache is not None else ModuleCache()
 
-    def parse(self, input_text: str) -> dict:
-        """Parse .seed file content"""
+    def parse(self, input_text, base_dir: str = None) -> dict:
+        """Parse .seed content (a str or a bytes-like buffer), resolving imports relative to base_dir"""
+        spec = None
         try:
-            lines = input_text.strip().splitlines()
-            
-            # Validate input starts with app declaration
-            non_empty_lines = [line.split('//')[0].strip() for line in lines if line.split('//')[0].strip()]
-            if not non_empty_lines:
-                raise ParseError("Empty input")
-            if not non_empty_lines[0].startswith('app '):
-                raise ParseError("File must start with app declaration")
-            
-            return self._parse_app(lines)
+            spec = self._parse_app(iter_lines(input_text))
+            if spec.get('imports'):
+                self._resolve_imports(spec, base_dir or os.getcwd())
+            return spec
             
         except Exception as e:
+            if spec is not None:
+                release_data(spec)
             if isinstance(e, ParseError):
                 raise
             raise ParseError(f"Failed to parse spec: {str(e)}")
+
+    def parse_file(self, path: str) -> dict:
+        """Parse a .seed file together with the files it imports
+
+        The file is memory-mapped and decoded one line at a time, so large
+        specs are never held in memory as a single string.
+        """
+        base_dir = os.path.dirname(os.path.abspath(path))
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return self.parse(b'', base_dir=base_dir)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return self.parse(buffer, base_dir=base_dir)
             
-    def _parse_app(self, lines: list) -> dict:
-        """Parse app and its contents"""
+    def _parse_app(self, lines, library: bool = False) -> dict:
+        """Parse app and its contents (or the models of an imported library) from an iterable of lines"""
+        data_sets = []  # Writers of every data set, so a failed parse removes their record files
+        try:
+            return self._parse_lines(lines, library, data_sets)
+        except BaseException:
+            for data_set in data_sets:
+                data_set.discard()
+            raise
+
+    def _parse_lines(self, lines, library: bool, data_sets: list) -> dict:
         spec = {
             'models': [],
             'screens': []
         }
+        imports = []
         
         block_stack = []  # Track block hierarchy (app, model, etc)
         brace_stack = []  # Track opening braces and their line numbers
         
-        for line_num, line in enumerate(lines, 1):
+        theme_tables = []  # Token tables of the open theme blocks
+        record_reader = None  # Reads the records of the open data set
+        data_set = None  # Writer of the open data set
+        
+        lines = iter(lines)
+        prev_line = None
+        declared = False
+        for line_num, raw_line in enumerate(lines, 1):
+            # Records are streamed into the data set; they may contain '//' in strings
+            if record_reader is not None:
+                try:
+                    for record in record_reader.feed(raw_line):
+                        data_set.append(record)
+                except DataError as e:
+                    raise ParseError(str(e), line_num=line_num, line_content=raw_line.strip(),
+                                     prev_line=prev_line, next_line=next(lines, None))
+                if record_reader.finished:
+                    spec['data'].append(data_set.finish())
+                    record_reader = None
+                    data_set = None
+                    brace_stack.pop()
+                prev_line = raw_line
+                continue
+            
             # Remove inline comments and strip whitespace
-            line = line.split('//')[0].strip()
+            line = raw_line.split('//')[0].strip()
             if not line:
+                prev_line = raw_line
                 continue
             
+            # Validate input starts with app declaration (after any imports);
+            # themes and shared models may be declared before the app
+            if not declared and not line.startswith('import '):
+                if not library and not line.startswith(('app ', 'theme ', 'model ')):
+                    raise ParseError("File must start with app declaration")
+                declared = True
+            
             try:
+                # Imports may contain braces, so handle them first
+                if line.startswith('import '):
+                    if block_stack not in ([], ['app']):
+                        raise ParseError("Imports must be at the top level or directly inside the app block")
+                    imports.append(self._parse_import(line, line_num))
+                
+                elif line.startswith('use '):
+                    if block_stack != ['app']:
+                        raise ParseError("'use theme' must be directly inside the app block")
+                    self._parse_use(line, spec['app'])
+                
+                # Data set header: 'Name: Model[] [' followed by records
+                elif block_stack and block_stack[-1] == 'data':
+                    if line == '}':
+                        brace_stack.pop()
+                        block_stack.pop()
+                    else:
+                        name, model, rest = self._parse_data_set(line)
+                        data = spec.setdefault('data', [])
+                        if any(d['name'] == name for d in data):
+                            raise ParseError(f"Duplicate data set name: {name}")
+                        data_set = DataSet(name, model, line_num)
+                        data_sets.append(data_set)
+                        brace_stack.append((line_num, line))
+                        record_reader = RecordReader()
+                        try:
+                            for record in record_reader.feed(rest):
+                                data_set.append(record)
+                        except DataError as e:
+                            raise ParseError(str(e))
+                        if record_reader.finished:
+                            data.append(data_set.finish())
+                            record_reader = None
+                            data_set = None
+                            brace_stack.pop()
+                
                 # Track opening braces and block types
-                if '{' in line:
+                elif '{' in line:
                     brace_stack.append((line_num, line))
-                    if line.startswith('app'):
+                    if line.startswith('app') and library:
+                        raise ParseError("Imported files cannot declare an app")
+                    elif line.startswith('app'):
                         # First check for quoted app name
                         parts = line.strip().split()
                         if len(parts) >= 2 and parts[1].startswith('"'):
@@ -63,7 +202,7 @@ class SeedParser:
                         if len(quote_parts) != 3:
                             raise ParseError("Invalid app declaration - expected 'app Name \"Title\" {'")
                         
-                        app_name = quote_parts[0].split()[1]
+                        app_name = sys.intern(quote_parts[0].split()[1])
                         app_title = quote_parts[1]
                         
                         if not app_name.isidentifier():
@@ -73,8 +212,30 @@ class SeedParser:
                         
                         spec['app'] = {'name': app_name, 'title': app_title}
                         block_stack.append('app')
+                    elif block_stack and block_stack[-1] in ('theme', 'theme-section', 'theme-group'):
+                        table = self._parse_theme_block(line, block_stack[-1], theme_tables[-1])
+                        theme_tables.append(table)
+                        block_stack.append('theme-section' if block_stack[-1] == 'theme' else 'theme-group')
+                    elif line.startswith('theme'):
+                        if library:
+                            raise ParseError("Imported files can only define models")
+                        if block_stack not in ([], ['app']):
+                            raise ParseError("Theme must be defined at the top level or directly inside the app block")
+                        theme = self._parse_theme(line)
+                        themes = spec.setdefault('themes', [])
+                        if any(t['name'] == theme['name'] for t in themes):
+                            raise ParseError(f"Duplicate theme name: {theme['name']}")
+                        themes.append(theme)
+                        theme_tables.append(theme)
+                        block_stack.append('theme')
+                    elif line.startswith('data'):
+                        if block_stack != ['app']:
+                            raise ParseError("Data must be defined directly inside the app block")
+                        if line != 'data {':
+                            raise ParseError("Invalid data block - expected 'data {'")
+                        block_stack.append('data')
                     elif line.startswith('model'):
-                        if 'app' not in block_stack:
+                        if block_stack and block_stack != ['app']:
                             raise ParseError("Model must be defined inside app block")
                         model = self._parse_model(line)
                         if any(m['name'] == model['name'] for m in spec['models']):
@@ -88,10 +249,13 @@ class SeedParser:
                         raise ParseError("Unexpected closing brace - no matching opening brace found")
                     opening_line_num, opening_line = brace_stack.pop()
                     if block_stack:
-                        block_stack.pop()
+                        if block_stack.pop().startswith('theme'):
+                            theme_tables.pop()
                 
                 # Handle screen declarations
                 elif line.startswith('screen'):
+                    if library:
+                        raise ParseError("Imported files can only define models")
                     if 'app' not in block_stack:
                         raise ParseError("Screen must be defined inside app block")
                     screen = self._parse_screen(line)
@@ -99,14 +263,19 @@ class SeedParser:
                         raise ParseError(f"Duplicate screen name: {screen['name']}")
                     spec['screens'].append(screen)
                 
+                # Handle theme tokens
+                elif block_stack and block_stack[-1] in ('theme-section', 'theme-group'):
+                    self._parse_theme_entry(line, theme_tables[-1])
+                elif block_stack and block_stack[-1] == 'theme':
+                    raise ParseError(f"Expected a theme section ({', '.join(THEME_SECTIONS)})")
+                
                 # Handle model fields
                 elif block_stack and block_stack[-1] == 'model' and line.strip():
                     current_model = spec['models'][-1]
                     self._parse_field(line, current_model)
             except ParseError as e:
-                # Get context lines
-                prev_line = lines[line_num-2] if line_num > 1 else None
-                next_line = lines[line_num] if line_num < len(lines) else None
+                # Get context lines (the input is consumed lazily, so read ahead one)
+                next_line = next(lines, None)
                 raise ParseError(
                     str(e),
                     line_num=line_num,
@@ -114,14 +283,222 @@ class SeedParser:
                     prev_line=prev_line,
                     next_line=next_line
                 )
+            prev_line = raw_line
             
+        if not declared and not library:
+            raise ParseError("Empty input" if not imports else "File must start with app declaration")
+        
         # Check for unclosed braces at end of parsing
+        if record_reader is not None:
+            raise ParseError(f"Unclosed data set from line {brace_stack[-1][0]}: {brace_stack[-1][1]}")
         if brace_stack:
             last_brace = brace_stack[-1]
             raise ParseError(f"Unclosed brace from line {last_brace[0]}: {last_brace[1]}")
         
+        if imports:
+            spec['imports'] = imports
         return spec
 
+    def _parse_import(self, line: str, line_num: int) -> dict:
+        """Parse 'import "./file.seed"' or 'import { A, B } from "./file.seed"'"""
+        match = IMPORT_PATTERN.fullmatch(line)
+        if not match:
+            raise ParseError("Invalid import - expected 'import \"./file.seed\"' or 'import { Name } from \"./file.seed\"'")
+        
+        names = None
+        if match.group(1) is not None:
+            names = [name.strip() for name in match.group(1).split(',') if name.strip()]
+            if not names:
+                raise ParseError("Import list cannot be empty")
+            for name in names:
+                if not name.isidentifier():
+                    raise ParseError(f"Invalid import name: {name}")
+        
+        return {'path': match.group(2), 'names': names, 'line_num': line_num, 'line_content': line}
+
+    def _parse_use(self, line: str, app: dict) -> None:
+        """Parse 'use theme Name'; a second theme is the app's dark mode theme"""
+        parts = line.split()
+        if len(parts) != 3 or parts[1] != 'theme' or not parts[2].isidentifier():
+            raise ParseError("Invalid use declaration - expected 'use theme Name'")
+        themes = app.setdefault('themes', [])
+        if parts[2] in themes:
+            raise ParseError(f"Theme used twice: {parts[2]}")
+        if len(themes) == 2:
+            raise ParseError("An app can use at most two themes (light and dark)")
+        themes.append(sys.intern(parts[2]))
+        app.setdefault('theme', themes[0])
+
+    def _parse_theme(self, line: str) -> dict:
+        """Parse 'theme Name ["Title"] [extends Base] {'"""
+        match = THEME_PATTERN.fullmatch(line)
+        if not match:
+            raise ParseError("Invalid theme declaration - expected 'theme Name \"Title\" {' or 'theme Name extends Base {'")
+        name, title, base = match.groups()
+        theme = {'name': sys.intern(name)}
+        if title is not None:
+            if not title.strip():
+                raise ParseError("Theme title cannot be empty")
+            theme['title'] = title
+        if base is not None:
+            theme['extends'] = sys.intern(base)
+        return theme
+
+    def _parse_theme_block(self, line: str, block: str, table: dict) -> dict:
+        """Open a theme section ('colors {') or a nested token group ('fonts: {')"""
+        if block == 'theme':
+            section = line[:-1].strip() if line.endswith('{') else ''
+            if section not in THEME_SECTIONS:
+                raise ParseError(f"Unknown theme section: '{section}' (expected one of {', '.join(THEME_SECTIONS)})")
+            if section in table:
+                raise ParseError(f"Duplicate theme section: {section}")
+            table[section] = {}
+            return table[section]
+        
+        match = THEME_ENTRY_PATTERN.fullmatch(line)
+        if not match or match.group(2) != '{':
+            raise ParseError("Invalid token group - expected 'name: {'")
+        key = self._theme_key(match.group(1), table)
+        table[key] = {}
+        return table[key]
+
+    def _parse_theme_entry(self, line: str, table: dict) -> None:
+        """Parse a 'name: value' token inside a theme section"""
+        match = THEME_ENTRY_PATTERN.fullmatch(line)
+        if not match or not match.group(2):
+            raise ParseError("Invalid theme token - expected 'name: value'")
+        key = self._theme_key(match.group(1), table)
+        value = match.group(2).strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        elif not re.fullmatch(r'[#\w.-]+', value):
+            raise ParseError(f"Invalid theme value: {value}")
+        table[key] = value
+
+    def _theme_key(self, key: str, table: dict) -> str:
+        key = key.strip('"')
+        if not re.fullmatch(r'[A-Za-z0-9_][\w-]*', key):
+            raise ParseError(f"Invalid theme token name: {key}")
+        if key in table:
+            raise ParseError(f"Duplicate theme token: {key}")
+        return sys.intern(key)
+
+    def _parse_data_set(self, line: str) -> tuple:
+        """Parse 'Name: Model[] [', returning the data set name, its model and the rest of the line"""
+        match = DATA_SET_PATTERN.fullmatch(line)
+        if not match:
+            raise ParseError("Invalid data set - expected 'Name: Model[] ['")
+        name, model, rest = match.groups()
+        return sys.intern(name), sys.intern(model), rest
+
+    def _parse_module(self, data, path: str) -> dict:
+        """Parse an imported .seed file, which may only contain imports and models"""
+        try:
+            return self._parse_app(iter_lines(data), library=True)
+        except ParseError as e:
+            raise ParseError(f"In {path}: {e}", e.line_num, e.line_content, e.prev_line, e.next_line)
+
+    def _import_path(self, imp: dict, base_dir: str) -> str:
+        """Resolve an import to an existing file path"""
+        if self._is_stdlib_import(imp):
+            raise ParseError(f"Only the main file can import {imp['path']}",
+                             line_num=imp['line_num'], line_content=imp['line_content'])
+        path = os.path.normpath(os.path.join(base_dir, imp['path']))
+        if not os.path.splitext(path)[1]:
+            path += '.seed'
+        if not os.path.isfile(path):
+            raise ParseError(f"Imported file not found: {imp['path']}",
+                             line_num=imp['line_num'], line_content=imp['line_content'])
+        return path
+
+    def _is_stdlib_import(self, imp: dict) -> bool:
+        """Check an import of a built-in "@stdlib/..." module; these are not files"""
+        if not imp['path'].startswith('@'):
+            return False
+        exported = StdLibManager().modules().get(imp['path'])
+        if exported is None:
+            raise ParseError(f"Unknown standard library module: {imp['path']}",
+                             line_num=imp['line_num'], line_content=imp['line_content'])
+        for name in imp['names'] or []:
+            if name not in exported:
+                raise ParseError(f"'{name}' is not defined in {imp['path']}",
+                                 line_num=imp['line_num'], line_content=imp['line_content'])
+        return True
+
+    def _resolve_imports(self, spec: dict, base_dir: str) -> None:
+        """Parse imported files and merge the imported models into spec
+
+        Files are loaded one after another, level by level, and each file is
+        parsed at most once through module_cache.
+        """
+        file_imports = [imp for imp in spec['imports'] if not self._is_stdlib_import(imp)]
+        if not file_imports:
+            return
+        
+        modules = {}
+        pending = [self._import_path(imp, base_dir) for imp in file_imports]
+        while pending:
+            batch = [path for path in dict.fromkeys(pending) if path not in modules]
+            for path in batch:
+                modules[path] = self.module_cache.load(path, self._parse_module)
+            pending = [
+                self._import_path(imp, os.path.dirname(path))
+                for path in batch
+                for imp in modules[path].get('imports', [])
+            ]
+        
+        namespaces = {}
+        
+        def namespace(path):
+            """Models visible in a module: its own plus everything it imports"""
+            if path in namespaces:
+                return namespaces[path]
+            namespaces[path] = {}  # Guards against import cycles
+            names = {}
+            for imp in modules[path].get('imports', []):
+                imported = namespace(self._import_path(imp, os.path.dirname(path)))
+                names.update(self._select_imports(imp, imported, path))
+            for model in modules[path]['models']:
+                names[model['name']] = model
+            namespaces[path] = names
+            return names
+        
+        imported = {}
+        for imp in file_imports:
+            path = self._import_path(imp, base_dir)
+            for name, model in self._select_imports(imp, namespace(path), path).items():
+                if name in imported and imported[name] is not model:
+                    raise ParseError(f"Model '{name}' is imported from more than one file",
+                                     line_num=imp['line_num'], line_content=imp['line_content'])
+                imported[name] = model
+        
+        local_names = {model['name'] for model in spec['models']}
+        for name in imported:
+            if name in local_names:
+                raise ParseError(f"Duplicate model name: {name} (also imported)")
+        
+        # Cached modules are shared between builds, so hand out copies
+        spec['models'] = [copy.deepcopy(model) for model in imported.values()] + spec['models']
+
+    def _select_imports(self, imp: dict, names: dict, path: str) -> dict:
+        """Pick the imported models (and the models they reference) from a namespace"""
+        if imp['names'] is None:
+            return dict(names)
+        
+        selected = {}
+        queue = list(imp['names'])
+        while queue:
+            name = queue.pop()
+            if name in selected:
+                continue
+            if name not in names:
+                raise ParseError(f"'{name}' is not defined in {imp['path']}",
+                                 line_num=imp['line_num'], line_content=imp['line_content'])
+            selected[name] = names[name]
+            queue.extend(field['type'] for field in names[name]['fields']
+                         if field.get('is_reference') and field['type'] in names)
+        return selected
+
     def _parse_model(self, line: str) -> dict:
         """Parse model declaration"""
         try:
@@ -129,7 +506,7 @@ class SeedParser:
             if len(parts) < 2:
                 raise ParseError("Invalid model declaration")
             
-            model_name = parts[1].strip('{').strip()
+            model_name = sys.intern(parts[1].strip('{').strip())
             if not model_name.isidentifier():
                 raise ParseError(f"Invalid model name: {model_name}")
                 
@@ -142,25 +519,58 @@ class SeedParser:
         """Parse screen declaration"""
         try:
             parts = line.split()
-            if len(parts) != 4 or parts[2] != 'using':
+            if len(parts) < 4 or parts[2] != 'using':
                 raise ParseError("Invalid screen declaration - expected 'screen Name using Model'")
                 
-            screen_name = parts[1]
-            model_name = parts[3]
+            screen_name = sys.intern(parts[1])
+            model_name = sys.intern(parts[3])
             
             if not screen_name.isidentifier():
                 raise ParseError(f"Invalid screen name: {screen_name}")
             if not model_name.isidentifier():
                 raise ParseError(f"Invalid model reference: {model_name}")
                 
-            return {
+            screen = {
                 'name': screen_name,
                 'model': model_name
             }
+            self._parse_screen_options(parts[4:], screen)
+            return screen
             
         except Exception as e:
             raise ParseError(f"Invalid screen declaration: {str(e)}")
 
+    def _parse_screen_options(self, tokens: list, screen: dict) -> None:
+        """Parse list options following 'using Model' (paginate, sort, filter)"""
+        i = 0
+        while i < len(tokens):
+            option = tokens[i]
+            if option in screen:
+                raise ParseError(f"Duplicate screen option: {option}")
+            if i + 1 >= len(tokens):
+                raise ParseError(f"Missing value after '{option}'")
+            value = tokens[i + 1]
+            i += 2
+            
+            if option == 'paginate':
+                if not value.isdigit() or int(value) < 1:
+                    raise ParseError(f"Page size must be a positive integer, got '{value}'")
+                screen['paginate'] = int(value)
+            elif option == 'sort':
+                if not value.isidentifier():
+                    raise ParseError(f"Invalid sort field: {value}")
+                direction = 'asc'
+                if i < len(tokens) and tokens[i] in ('asc', 'desc'):
+                    direction = tokens[i]
+                    i += 1
+                screen['sort'] = {'field': sys.intern(value), 'direction': direction}
+            elif option == 'filter':
+                if not value.isidentifier():
+                    raise ParseError(f"Invalid filter field: {value}")
+                screen['filter'] = sys.intern(value)
+            else:
+                raise ParseError(f"Unknown screen option: '{option}'")
+
     def _parse_field(self, line: str, model: dict) -> None:
         """Parse model field"""
         try:
@@ -168,14 +578,17 @@ class SeedParser:
             if len(parts) < 2:
                 raise ParseError(f"Field declaration must have at least a name and type")
                 
-            field_name = parts[0]
-            field_type = parts[1]
+            # Names and types repeat across thousands of fields; interning
+            # keeps one copy of each and makes equal names share identity
+            field_name = sys.intern(parts[0])
+            field_type = sys.intern(parts[1])
             
             if not field_name.isidentifier():
                 raise ParseError(f"'{field_name}' is not a valid field name")
             
             # Check if type is a basic type or a valid model reference
-            if field_type not in self.valid_types:
+            descriptor = self.valid_types.get(field_type)
+            if descriptor is None:
                 # For model references, only allow simple identifiers without underscores
                 if not field_type.isidentifier() or '_' in field_type:
                     raise ParseError(f"'{field_type}' is not a valid type")
@@ -184,7 +597,7 @@ class SeedParser:
                 'name': field_name,
                 'type': field_type,
                 'default': None,
-                'is_reference': field_type not in self.valid_types
+                'is_reference': descriptor is None
             }
             
             # Handle 'as title' syntax first
@@ -193,6 +606,15 @@ class SeedParser:
                 field['is_title'] = True
                 remaining_parts = remaining_parts[2:]
             
+            # Then modifiers such as 'indexed'
+            while remaining_parts and remaining_parts[0] in FIELD_MODIFIERS:
+                modifier = remaining_parts.pop(0)
+                if field.get(modifier):
+                    raise ParseError(f"Duplicate field modifier: '{modifier}'")
+                if modifier == 'searchable' and field_type not in SEARCHABLE_TYPES:
+                    raise ParseError(f"Only text and email fields can be searchable, '{field_name}' is {field_type}")
+                field[modifier] = True
+            
             # Then handle default value if present
             if remaining_parts:
                 if remaining_parts[0] != '=':
@@ -201,17 +623,12 @@ class SeedParser:
                     raise ParseError(f"Missing value after '='")
                 default_value = remaining_parts[1].strip('"')  # Remove quotes if present
                 
-                # Validate default value based on field type
-                if field_type == 'bool':
-                    if default_value.lower() not in ['true', 'false']:
-                        raise ParseError(f"Invalid default value for bool field: {default_value}")
-                    field['default'] = default_value.lower()
-                elif field_type == 'num':
-                    try:
-                        float(default_value)
-                        field['default'] = default_value
-                    except ValueError:
-                        raise ParseError(f"Invalid default value for num field: {default_value}")
+                # Validate (and normalize) default value based on field type
+                if descriptor is not None:
+                    normalized = descriptor.validate_default(default_value)
+                    if normalized is None:
+                        raise ParseError(f"Invalid default value for {field_type} field: {default_value}")
+                    field['default'] = normalized
                 else:
                     field['default'] = default_value
                 
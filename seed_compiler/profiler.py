@@ -0,0 +1,86 @@
+import time
+import threading
+from jinja2 import nodes
+from jinja2.ext import Extension
+
+class TemplateProfiler:
+    """Collects render time, output size and call count per template"""
+
+    def __init__(self, blocks=False):
+        self.blocks = blocks
+        self.templates = {}
+        self.block_stats = {}
+        self._lock = threading.Lock()  # Async generation renders files on several threads
+
+    def record(self, template_name: str, seconds: float, size: int):
+        """Record one full render of a template"""
+        self._add(self.templates, template_name, seconds, size)
+
+    def record_block(self, template_name: str, block_name: str, seconds: float, size: int):
+        """Record one render of a {% profile %} block inside a template"""
+        self._add(self.block_stats, f"{template_name}:{block_name}", seconds, size)
+
+    def _add(self, table: dict, key: str, seconds: float, size: int):
+        with self._lock:
+            stats = table.setdefault(key, {'calls': 0, 'seconds': 0.0, 'bytes': 0})
+            stats['calls'] += 1
+            stats['seconds'] += seconds
+            stats['bytes'] += size
+
+    def reset(self):
+        """Drop all collected measurements"""
+        self.templates.clear()
+        self.block_stats.clear()
+
+    def report(self) -> str:
+        """Format the measurements as a table ranked by total render time"""
+        lines = ["Template render profile (ranked by total time)"]
+        lines.extend(self._format_table(self.templates))
+        if self.block_stats:
+            lines.append("")
+            lines.append("Blocks (time includes nested blocks)")
+            lines.extend(self._format_table(self.block_stats))
+        return '\n'.join(lines)
+
+    def _format_table(self, table: dict) -> list:
+        total = sum(stats['seconds'] for stats in table.values()) or 1.0
+        width = max([len(name) for name in table] + [8])
+        rows = [f"  {'name':<{width}}  {'calls':>6}  {'total ms':>9}  {'avg ms':>8}  {'%':>5}  {'bytes':>10}"]
+        ranked = sorted(table.items(), key=lambda item: item[1]['seconds'], reverse=True)
+        for name, stats in ranked:
+            total_ms = stats['seconds'] * 1000
+            avg_ms = total_ms / stats['calls']
+            share = stats['seconds'] / total * 100
+            rows.append(
+                f"  {name:<{width}}  {stats['calls']:>6}  {total_ms:>9.2f}  {avg_ms:>8.3f}  {share:>5.1f}  {stats['bytes']:>10}"
+            )
+        return rows
+
+class ProfileExtension(Extension):
+    """Adds {% profile 'name' %}...{% endprofile %} blocks to templates
+
+    Blocks render their body unchanged; when the environment's profiler has
+    block timing enabled, each block's render time and output size are
+    recorded under 'Template:name'.
+    """
+    tags = {'profile'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(profiler=None)
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        block_name = parser.parse_expression()
+        body = parser.parse_statements(['name:endprofile'], drop_needle=True)
+        args = [nodes.Const(parser.name), block_name]
+        return nodes.CallBlock(self.call_method('_profile', args), [], [], body).set_lineno(lineno)
+
+    def _profile(self, template_name, block_name, caller):
+        profiler = self.environment.profiler
+        if profiler is None or not profiler.blocks:
+            return caller()
+        start = time.perf_counter()
+        output = caller()
+        profiler.record_block(template_name, block_name, time.perf_counter() - start, len(output))
+        return output
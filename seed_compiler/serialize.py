@@ -0,0 +1,201 @@
+import sys
+import struct
+from types import MappingProxyType
+
+MAGIC = b'SEED'
+FORMAT_VERSION = 1
+
+# Value tags
+_NONE = 0
+_TRUE = 1
+_FALSE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_LIST = 6
+_DICT = 7
+_FIELD = 8
+
+# Field records: name, type, flags; a default value follows when FLAG_DEFAULT is set
+_FIELD_RECORD = struct.Struct('<IIB')
+_FLAG_DEFAULT = 1
+_FLAG_TITLE = 2
+_FLAG_REFERENCE = 4
+_FLAG_INDEXED = 8
+_FLAG_SEARCHABLE = 16
+_FIELD_FLAGS = (('is_title', _FLAG_TITLE), ('is_reference', _FLAG_REFERENCE), ('indexed', _FLAG_INDEXED),
+                ('searchable', _FLAG_SEARCHABLE))
+_FIELD_KEYS = {'name', 'type', 'default'} | {key for key, _ in _FIELD_FLAGS}
+
+_HEADER = struct.Struct('<4sBI')
+_U32 = struct.Struct('<I')
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+
+class SerializeError(Exception):
+    """Error for data that cannot be encoded or decoded"""
+
+def dumps(spec) -> bytes:
+    """Encode a parsed spec (or IR) into the compact binary format
+
+    Every string is stored once in a table and referenced by index; model
+    fields use fixed-layout records. Read-only mappings and tuples from the
+    IR are written as dicts and lists.
+    """
+    strings = {}
+    body = bytearray()
+    _encode(spec, body, strings)
+
+    table = bytearray()
+    for string in strings:
+        data = string.encode('utf-8')
+        table += _U32.pack(len(data))
+        table += data
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, len(strings)) + bytes(table) + bytes(body)
+
+def dump(spec, f):
+    """Write the binary encoding of a spec to a binary file object"""
+    f.write(dumps(spec))
+
+def loads(data) -> dict:
+    """Decode a spec written by dumps"""
+    try:
+        magic, version, count = _HEADER.unpack_from(data, 0)
+    except struct.error:
+        raise SerializeError("Truncated header")
+    if magic != MAGIC:
+        raise SerializeError("Not a serialized spec")
+    if version != FORMAT_VERSION:
+        raise SerializeError(f"Unsupported format version: {version}")
+
+    offset = _HEADER.size
+    strings = []
+    try:
+        for _ in range(count):
+            (length,) = _U32.unpack_from(data, offset)
+            offset += 4
+            strings.append(sys.intern(bytes(data[offset:offset + length]).decode('utf-8')))
+            offset += length
+        value, offset = _decode(data, offset, strings)
+    except (struct.error, IndexError, ValueError) as e:  # ValueError covers UnicodeDecodeError
+        raise SerializeError(f"Corrupt spec data: {e}")
+    if offset != len(data):
+        raise SerializeError("Trailing data after spec")
+    return value
+
+def load(f) -> dict:
+    """Read a spec written by dump from a binary file object"""
+    return loads(f.read())
+
+def _string(value: str, strings: dict) -> int:
+    index = strings.get(value)
+    if index is None:
+        index = strings[value] = len(strings)
+    return index
+
+def _is_field(value: dict) -> bool:
+    return (
+        'name' in value and 'type' in value
+        and _FIELD_KEYS.issuperset(value)
+        and isinstance(value['name'], str) and isinstance(value['type'], str)
+        and all(isinstance(value.get(key, False), bool) for key, _ in _FIELD_FLAGS)
+    )
+
+def _encode(value, out: bytearray, strings: dict):
+    if value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        try:
+            out += _I64.pack(value)
+        except struct.error:
+            raise SerializeError(f"Integer out of range: {value}")
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        out.append(_STR)
+        out += _U32.pack(_string(value, strings))
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        out += _U32.pack(len(value))
+        for item in value:
+            _encode(item, out, strings)
+    elif isinstance(value, (dict, MappingProxyType)):
+        if _is_field(value):
+            _encode_field(value, out, strings)
+            return
+        out.append(_DICT)
+        out += _U32.pack(len(value))
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise SerializeError(f"Mapping keys must be strings, got {type(key).__name__}")
+            out += _U32.pack(_string(key, strings))
+            _encode(item, out, strings)
+    else:
+        raise SerializeError(f"Cannot serialize value of type {type(value).__name__}")
+
+def _encode_field(field, out: bytearray, strings: dict):
+    # Absent optional keys are recorded as flags so they round-trip exactly
+    flags = 0
+    if 'default' in field:
+        flags |= _FLAG_DEFAULT
+    for key, flag in _FIELD_FLAGS:
+        if field.get(key):
+            flags |= flag
+    presence = sum(1 << i for i, (key, _) in enumerate(_FIELD_FLAGS) if key in field)
+
+    out.append(_FIELD)
+    out += _FIELD_RECORD.pack(_string(field['name'], strings), _string(field['type'], strings), flags)
+    out.append(presence)
+    if 'default' in field:
+        _encode(field['default'], out, strings)
+
+def _decode(data, offset: int, strings: list):
+    tag = data[offset]
+    offset += 1
+    if tag == _STR:
+        return strings[_U32.unpack_from(data, offset)[0]], offset + 4
+    if tag == _DICT:
+        (count,) = _U32.unpack_from(data, offset)
+        offset += 4
+        value = {}
+        for _ in range(count):
+            key = strings[_U32.unpack_from(data, offset)[0]]
+            value[key], offset = _decode(data, offset + 4, strings)
+        return value, offset
+    if tag == _LIST:
+        (count,) = _U32.unpack_from(data, offset)
+        offset += 4
+        value = []
+        for _ in range(count):
+            item, offset = _decode(data, offset, strings)
+            value.append(item)
+        return value, offset
+    if tag == _FIELD:
+        name, type_, flags = _FIELD_RECORD.unpack_from(data, offset)
+        offset += _FIELD_RECORD.size
+        presence = data[offset]
+        offset += 1
+        field = {'name': strings[name], 'type': strings[type_]}
+        if flags & _FLAG_DEFAULT:
+            field['default'], offset = _decode(data, offset, strings)
+        for i, (key, flag) in enumerate(_FIELD_FLAGS):
+            if presence & (1 << i):
+                field[key] = bool(flags & flag)
+        return field, offset
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _INT:
+        return _I64.unpack_from(data, offset)[0], offset + 8
+    if tag == _FLOAT:
+        return _F64.unpack_from(data, offset)[0], offset + 8
+    raise SerializeError(f"Unknown value tag: {tag}")
@@ -0,0 +1,219 @@
+import threading
+
+# Named colors usable in theme color values (besides hex values and theme color references)
+COLORS = {
+    # Basic colors
+    'white': '#ffffff',
+    'black': '#000000',
+    'red': '#ef4444',
+    'blue': '#3b82f6',
+    'green': '#10b981',
+    'yellow': '#f59e0b',
+    'purple': '#8b5cf6',
+    'orange': '#f97316',
+    # Geographic colors
+    'california-blue': '#0077be',
+    'mediterranean-blue': '#1a5f7a',
+    'california-gold': '#fdb515',
+    # Natural colors
+    'coral-green': '#84b082',
+    'forest-green': '#228b22',
+    'ocean-blue': '#00a0b0',
+    'sunset-yellow': '#fad6a5',
+    'midnight-black': '#141414',
+    'pearl-white': '#f5f5f1',
+    # Material colors
+    'slate-gray': '#708090',
+    'ruby-red': '#e0115f',
+    'emerald-green': '#50c878',
+}
+
+# Color modifiers: how far each channel is mixed towards white or black
+MODIFIERS = {
+    'light': ('#ffffff', 0.3),
+    'pale': ('#ffffff', 0.7),
+    'dark': ('#000000', 0.3),
+    'bright': ('#ffffff', 0.15),
+}
+
+THEMES_SOURCE = '''
+theme Default "SeedSpec Default Theme" {
+  metadata {
+    version: "1.0.0"
+    description: "Default light theme optimized for readability and accessibility"
+  }
+
+  colors {
+    primary: ocean-blue
+    secondary: forest-green
+    background: white
+    text: black
+
+    success: emerald-green
+    error: ruby-red
+    warning: california-gold
+    info: mediterranean-blue
+
+    hover: primary.light
+    active: primary.dark
+    disabled: slate-gray
+    selected: primary.pale
+
+    valid: success
+    invalid: error
+    pending: info
+
+    border: slate-gray.light
+    divider: slate-gray.pale
+    shadow: black.transparent
+    overlay: black.transparent
+
+    heading: text.dark
+    body: text
+    caption: text.light
+    placeholder: text.pale
+
+    link: primary
+    linkVisited: primary.dark
+    button: primary
+    buttonText: white
+
+    input: white
+    inputBorder: border
+    inputFocus: primary
+    inputPlaceholder: placeholder
+
+    nav: background.dark
+    navText: text.light
+    navActive: primary
+
+    highlight: sunset-yellow.pale
+    accent: coral-green
+
+    card: white
+    modal: white
+    tooltip: text.dark
+
+    focus: primary
+    selection: primary.pale
+  }
+
+  typography {
+    fonts: {
+      body: sans
+      heading: sans
+      mono: mono
+    }
+    weights: {
+      light: 300
+      regular: 400
+      medium: 500
+      bold: 700
+    }
+    sizes: {
+      xs: 0.75
+      sm: 0.875
+      base: 1
+      lg: 1.125
+      xl: 1.25
+      "2xl": 1.5
+      "3xl": 1.875
+      "4xl": 2.25
+    }
+    lineHeights: {
+      tight: 1.25
+      base: 1.5
+      loose: 1.75
+    }
+  }
+
+  spacing {
+    xs: 0.25
+    sm: 0.5
+    base: 1
+    lg: 1.5
+    xl: 2
+    "2xl": 3
+    "3xl": 4
+  }
+
+  radii {
+    none: 0
+    sm: 0.125
+    base: 0.25
+    lg: 0.5
+    full: 9999
+  }
+}
+
+theme Dark "SeedSpec Dark Theme" extends Default {
+  metadata {
+    version: "1.0.0"
+    description: "Default dark theme with reduced eye strain"
+  }
+
+  colors {
+    background: midnight-black
+    text: pearl-white
+
+    primary: ocean-blue.light
+    secondary: forest-green.light
+
+    card: background.light
+    modal: background.light
+
+    hover: primary.pale
+    selected: primary.dark
+  }
+}
+'''
+
+class StdLibManager:
+    """Built-in modules importable as "@stdlib/<name>" (currently only themes)"""
+
+    _themes = None
+    _lock = threading.Lock()
+
+    def modules(self) -> dict:
+        """Map each standard library module to the names it exports"""
+        return {'@stdlib/themes': list(self.themes())}
+
+    def themes(self) -> dict:
+        """Parsed standard library themes by name (parsed once per process)"""
+        with StdLibManager._lock:
+            if StdLibManager._themes is None:
+                from .parser import SeedParser
+                spec = SeedParser().parse(THEMES_SOURCE)
+                StdLibManager._themes = {theme['name']: theme for theme in spec['themes']}
+            return StdLibManager._themes
+
+    def get_standard_theme(self, theme_name: str):
+        """Return a standard library theme, or None"""
+        return self.themes().get(theme_name)
+
+    def resolve_color(self, color_name: str):
+        """Resolve a named color (optionally with a modifier) or hex value to a hex value, or None"""
+        if color_name.startswith('#'):
+            return color_name.lower()
+        base, _, modifier = color_name.partition('.')
+        if base not in COLORS:
+            return None
+        if not modifier:
+            return COLORS[base]
+        return apply_modifier(COLORS[base], modifier)
+
+def _channels(hex_color: str) -> list:
+    value = hex_color.lstrip('#')
+    if len(value) == 3:
+        value = ''.join(c * 2 for c in value)
+    return [int(value[i:i + 2], 16) for i in (0, 2, 4)]
+
+def apply_modifier(hex_color: str, modifier: str):
+    """Apply a color modifier (light, dark, pale, bright, transparent) to a hex color, or None if unknown"""
+    if modifier == 'transparent':
+        return hex_color[:7].lower() + '80'
+    if modifier not in MODIFIERS:
+        return None
+    target, amount = MODIFIERS[modifier]
+    mixed = [round(c + (t - c) * amount) for c, t in zip(_channels(hex_color[:7]), _channels(target))]
+    return '#' + ''.join(f"{c:02x}" for c in mixed)
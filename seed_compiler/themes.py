@@ -0,0 +1,198 @@
+import os
+import copy
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from .analyzer import AnalysisError
+from .cache import context_hash
+from .stdlib import StdLibManager, COLORS, THEMES_SOURCE, apply_modifier
+
+# Keys of a parsed theme that are not token tables
+THEME_HEADER_KEYS = ('name', 'title', 'extends')
+
+# Bump when color resolution (e.g. apply_modifier) changes, so memoized and
+# on-disk resolved themes from older compilers are not reused
+RESOLVER_VERSION = 1
+
+# Part of every memo key: the resolver version and the named colors and
+# standard library themes that resolved colors are derived from
+RESOLVER_KEY = f"{RESOLVER_VERSION}:{context_hash({'colors': COLORS, 'themes': THEMES_SOURCE})}"
+
+def merge_tables(base: dict, override: dict) -> dict:
+    """Deep-merge theme token tables; values in override win"""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_tables(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+class ThemeResolver:
+    """Flattens theme inheritance chains into resolved token tables
+
+    Themes are resolved in dependency order (bases first) and each theme is
+    resolved once: the result is memoized under a hash of the theme's own
+    tokens, its base's key and RESOLVER_KEY, so a theme whose source and chain did not
+    change is never walked again. The memo is shared by all resolvers in
+    the process, so apps extending the same "@stdlib/themes" bases reuse
+    the resolved tokens; with cache_dir set it is also kept on disk.
+
+    A resolved theme has every color turned into a hex value ('colors'),
+    the raw names it came from ('color_sources') and the merged metadata,
+    typography, spacing and radii tables.
+    """
+
+    _memo = OrderedDict()
+    _memo_lock = threading.Lock()
+    max_entries = 512
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def resolve_all(self, themes, used=()) -> dict:
+        """Resolve local themes, and the standard library themes named in used, by name"""
+        local = {}
+        for theme in themes:
+            if theme['name'] in local:
+                raise AnalysisError(f"Duplicate theme name: {theme['name']}")
+            local[theme['name']] = theme
+        standard = StdLibManager().themes()
+
+        entries = {}  # local name or ('@stdlib', name) -> (key, merged tables, resolved theme)
+        visiting = []
+
+        def visit(node):
+            if node in entries:
+                return entries[node]
+            name = node[1] if isinstance(node, tuple) else node
+            if node in visiting:
+                chain = [n[1] if isinstance(n, tuple) else n for n in visiting[visiting.index(node):]]
+                raise AnalysisError(f"Theme inheritance cycle: {' -> '.join(chain + [name])}")
+            theme = standard[name] if isinstance(node, tuple) else local[name]
+
+            base = None
+            base_name = theme.get('extends')
+            if base_name is not None:
+                # Local themes shadow the standard library, except for standard themes themselves
+                if base_name in local and not isinstance(node, tuple):
+                    base_node = base_name
+                elif base_name in standard:
+                    base_node = ('@stdlib', base_name)
+                else:
+                    raise AnalysisError(f"Theme '{name}' extends unknown theme '{base_name}'")
+                visiting.append(node)
+                base = visit(base_node)
+                visiting.pop()
+
+            entries[node] = self._resolve(theme, base)
+            return entries[node]
+
+        resolved = {}
+        for name in used:
+            if name not in local:
+                if name not in standard:
+                    raise AnalysisError(f"Unknown theme: {name}")
+                resolved[name] = visit(('@stdlib', name))[2]
+        for name in local:
+            resolved[name] = visit(name)[2]
+        return resolved
+
+    def _resolve(self, theme: dict, base) -> tuple:
+        """Resolve one theme on top of its (already resolved) base entry, using the memo"""
+        tables = {key: value for key, value in theme.items() if key not in THEME_HEADER_KEYS}
+        header = {key: theme[key] for key in THEME_HEADER_KEYS if key in theme}
+        key = hashlib.sha256(
+            f"{RESOLVER_KEY}\0{context_hash({**header, **tables})}\0{base[0] if base else ''}".encode('utf-8')
+        ).hexdigest()
+
+        entry = self._memo_get(key)
+        if entry is None:
+            entry = self._read_disk(key)
+            if entry is None:
+                self.misses += 1
+                merged = merge_tables(base[1] if base else {}, copy.deepcopy(tables))
+                entry = (key, merged, {**header, **self._flatten(theme['name'], merged)})
+                self._write_disk(entry)
+            else:
+                self.hits += 1
+            self._memo_put(entry)
+        else:
+            self.hits += 1
+        return entry
+
+    def _flatten(self, name: str, tables: dict) -> dict:
+        """Turn merged token tables into the resolved form"""
+        sources = tables.get('colors', {})
+        colors = {}
+
+        def color(slot, chain):
+            if slot in colors:
+                return colors[slot]
+            if slot in chain:
+                raise AnalysisError(f"Color reference cycle in theme '{name}': {' -> '.join(chain + [slot])}")
+            value = sources[slot]
+            if value.startswith('#'):
+                colors[slot] = value.lower()
+                return colors[slot]
+            # Theme colors take precedence over named colors
+            base, _, modifier = value.partition('.')
+            if base in sources:
+                hex_color = color(base, chain + [slot])
+            elif base in COLORS:
+                hex_color = COLORS[base]
+            else:
+                raise AnalysisError(f"Theme '{name}' color '{slot}' uses unknown color '{base}'")
+            if modifier:
+                hex_color = apply_modifier(hex_color, modifier)
+                if hex_color is None:
+                    raise AnalysisError(f"Theme '{name}' color '{slot}' uses unknown modifier '{modifier}'")
+            colors[slot] = hex_color
+            return hex_color
+
+        for slot in sources:
+            color(slot, [])
+        return {
+            **{key: value for key, value in tables.items() if key != 'colors'},
+            'colors': {slot: colors[slot] for slot in sources},
+            'color_sources': dict(sources)
+        }
+
+    def _memo_get(self, key: str):
+        with ThemeResolver._memo_lock:
+            entry = ThemeResolver._memo.get(key)
+            if entry is not None:
+                ThemeResolver._memo.move_to_end(key)
+            return entry
+
+    def _memo_put(self, entry: tuple):
+        with ThemeResolver._memo_lock:
+            ThemeResolver._memo[entry[0]] = entry
+            while len(ThemeResolver._memo) > self.max_entries:
+                ThemeResolver._memo.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_disk(self, key: str):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(key), encoding='utf-8') as f:
+                data = json.load(f)
+            return (key, data['merged'], data['resolved'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_disk(self, entry: tuple):
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._disk_path(entry[0])
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'merged': entry[1], 'resolved': entry[2]}, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,86 @@
+import pytest
+import os
+import tempfile
+from seed_compiler.parser import SeedParser
+from seed_compiler.analyzer import Analyzer, AnalysisError
+from seed_compiler.generator import Generator
+
+@pytest.fixture
+def blog_spec():
+    return SeedParser().parse("""
+    app Blog "Blog" {
+        model Author {
+            name text as title
+        }
+        
+        model Post {
+            title text
+            author Author
+            editor Author
+        }
+        
+        screen Posts using Post sort title
+    }
+    """)
+
+def test_resolves_references(blog_spec):
+    """Test that references, reverse references and imports are resolved"""
+    ir = Analyzer().analyze(blog_spec)
+    
+    assert ir['model_index'] == {'Author': 0, 'Post': 1}
+    author, post = ir['models']
+    assert post['references'] == ('Author',)
+    assert author['referenced_by'] == ('Post',)
+    assert post['fields'][1]['ref_index'] == 0
+    assert post['fields'][0]['ref_index'] is None
+    
+    screen = ir['screens'][0]
+    assert screen['model'] is post
+    assert screen['imports'] == ('Post', 'Author')
+
+def test_ir_is_frozen(blog_spec):
+    """Test that the IR is read-only and the parsed spec is left untouched"""
+    analyzer = Analyzer()
+    ir = analyzer.analyze(blog_spec)
+    
+    with pytest.raises(TypeError):
+        ir['models'][0]['name'] = 'Writer'
+    assert isinstance(ir['models'][0]['fields'], tuple)
+    assert blog_spec['screens'][0]['model'] == 'Post'
+    assert analyzer.analyze(ir) is ir
+
+def test_unknown_references():
+    """Test that unresolved models and fields are reported"""
+    analyzer = Analyzer()
+    
+    with pytest.raises(AnalysisError) as e:
+        analyzer.analyze({
+            'models': [{'name': 'Post', 'fields': [{'name': 'author', 'type': 'Author'}]}],
+            'screens': []
+        })
+    assert "references unknown model 'Author'" in str(e.value)
+    
+    with pytest.raises(AnalysisError) as e:
+        analyzer.analyze({'models': [], 'screens': [{'name': 'Posts', 'model': 'Post'}]})
+    assert "uses unknown model 'Post'" in str(e.value)
+    
+    with pytest.raises(AnalysisError) as e:
+        analyzer.analyze({
+            'models': [{'name': 'Post', 'fields': [{'name': 'title', 'type': 'text'}]}],
+            'screens': [{'name': 'Posts', 'model': 'Post', 'sort': {'field': 'date', 'direction': 'asc'}}]
+        })
+    assert "unknown field 'Post.date'" in str(e.value)
+
+def test_generator_uses_resolved_imports(blog_spec):
+    """Test that screens import the hooks of referenced models exactly once"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator().generate(Analyzer().analyze(blog_spec), tmpdir)
+        
+        with open(os.path.join(tmpdir, 'src/screens/Posts.js')) as f:
+            content = f.read()
+            assert content.count("import { useAuthor } from '../models/Author';") == 1
+            assert 'const { items: authorItems } = useAuthor();' in content
+        
+        with open(os.path.join(tmpdir, 'src/models/Post.js')) as f:
+            content = f.read()
+            assert content.count("import { useAuthor } from './Author';") == 1
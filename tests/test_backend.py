@@ -0,0 +1,130 @@
+import json
+import sqlite3
+import threading
+import importlib.util
+import urllib.parse
+import urllib.request
+from http.server import ThreadingHTTPServer
+import pytest
+from seed_compiler.parser import SeedParser
+from seed_compiler.generator import Generator
+
+SPEC = """
+app Shop "Shop" {
+    model Customer {
+        name text as title
+    }
+    model Order {
+        label text as title searchable
+        total num = 0
+        paid bool = false
+        customer Customer
+    }
+    data {
+        Orders: Order[] [
+            { label: "First", total: 5 },
+            { label: "Second", paid: true },
+            { label: "Third" }
+        ]
+    }
+    screen Orders using Order sort total desc filter label
+}
+"""
+
+def load_server(tmp_path):
+    Generator(backend='sqlite').generate(SeedParser().parse(SPEC), str(tmp_path))
+    spec = importlib.util.spec_from_file_location('generated_server', tmp_path / 'server' / 'server.py')
+    server = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(server)
+    return server
+
+def test_generate_sqlite_backend(tmp_path):
+    """Test that the backend target emits the server, API helper and paging model hooks"""
+    server = load_server(tmp_path)
+    assert server.MODELS['orders']['columns'] == {
+        'label': 'TEXT', 'total': 'NUMERIC', 'paid': 'INTEGER', 'customer': 'TEXT'
+    }
+
+    model = (tmp_path / 'src' / 'models' / 'Order.js').read_text()
+    assert "const COLLECTION = '/api/orders';" in model
+    assert 'page.next' in model
+    assert 'do {' not in model  # Later pages load on demand, not all on mount
+    assert 'hasMore, loadMore };' in model
+    screen = (tmp_path / 'src' / 'screens' / 'Orders.js').read_text()
+    assert 'onClick={loadMore}' in screen
+    # Sort, filter and search go to the server instead of running over the loaded pages
+    assert "useOrder({ sort: 'total', order: sortDirection, q: sentText.search, 'label.contains': sentText.filter })" in screen
+    assert 'compareValues' not in screen
+    assert 'localStorage' not in model
+    assert (tmp_path / 'src' / 'utils' / 'api.js').exists()
+    assert json.loads((tmp_path / 'package.json').read_text())['proxy'] == 'http://localhost:8000'
+
+    with pytest.raises(ValueError, match="Unknown backend: mongo"):
+        Generator(backend='mongo')
+
+def test_sqlite_backend_endpoints(tmp_path):
+    """Test tables, indexes, seeding and the paginated CRUD endpoints"""
+    server = load_server(tmp_path)
+    db_path = str(tmp_path / 'app.db')
+    server.Handler.store = server.Store(db_path)
+    server.Handler.store.setup()
+    server.Handler.store.setup()  # Seed data is loaded once per version
+
+    indexes = {row[0] for row in sqlite3.connect(db_path).execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {'Order_label', 'Order_customer', 'Order_total', 'Customer_name'} <= indexes
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), server.Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{httpd.server_address[1]}/api/orders'
+
+    def call(method, url, body=None):
+        data = None if body is None else json.dumps(body).encode('utf-8')
+        request = urllib.request.Request(url, data=data, method=method, headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, json.loads(response.read() or b'null')
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    try:
+        status, page = call('GET', f'{base}?limit=2')
+        assert status == 200
+        assert [item['id'] for item in page['items']] == ['Orders-1', 'Orders-2']
+        assert page['items'][1]['paid'] is True
+        status, page = call('GET', f"{base}?limit=2&cursor={page['next']}")
+        assert [item['label'] for item in page['items']] == ['Third'] and page['next'] is None
+
+        # Sorted pages continue from the sort position of the last item, ties in insertion order
+        def sorted_ids(query):
+            ids, cursor = [], None
+            while True:
+                url = f'{base}?limit=2&{query}' + ('' if cursor is None else f'&cursor={urllib.parse.quote(cursor)}')
+                page = call('GET', url)[1]
+                ids += [item['id'] for item in page['items']]
+                cursor = page['next']
+                if cursor is None:
+                    return ids
+        assert sorted_ids('sort=total&order=desc') == ['Orders-1', 'Orders-3', 'Orders-2']
+        assert sorted_ids('sort=total') == ['Orders-2', 'Orders-3', 'Orders-1']
+        assert sorted_ids('sort=customer&order=desc') == ['Orders-3', 'Orders-2', 'Orders-1']
+        assert sorted_ids('sort=customer') == ['Orders-1', 'Orders-2', 'Orders-3']
+        assert [item['id'] for item in call('GET', f'{base}?q=SEC')[1]['items']] == ['Orders-2']
+        assert [item['id'] for item in call('GET', f'{base}?label.contains=ir')[1]['items']] == ['Orders-1', 'Orders-3']
+        assert call('GET', f'{base}?label.contains=%25')[1]['items'] == []
+        assert call('GET', f'{base}?sort=owner') == (400, {'error': 'Unknown field: owner'})
+        assert call('GET', f'{base}?sort=total&cursor=x') == (400, {'error': 'Invalid cursor'})
+
+        assert call('POST', base, {'id': 'o4', 'label': 'Fourth', 'total': 2}) == (
+            201, {'id': 'o4', 'label': 'Fourth', 'total': 2, 'paid': False, 'customer': None}
+        )
+        assert call('POST', base, {'id': 'o4', 'label': 'Again'})[0] == 409
+        assert call('POST', base, {'id': 'o5', 'label': 'Fifth'})[1]['total'] == 0
+        assert call('DELETE', f'{base}/o5') == (204, None)
+        assert call('PATCH', f'{base}/o4', {'paid': True})[1]['paid'] is True
+        assert [item['id'] for item in call('GET', f'{base}?paid=true')[1]['items']] == ['Orders-2', 'o4']
+        assert call('DELETE', f'{base}/o4') == (204, None)
+        assert call('GET', f'{base}/o4') == (404, {'error': 'No Order with id o4'})
+        assert call('POST', base, {'owner': 'x'}) == (400, {'error': 'Unknown field: owner'})
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
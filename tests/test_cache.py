@@ -0,0 +1,94 @@
+import pytest
+import os
+import hashlib
+import tempfile
+from seed_compiler import generator as generator_module
+from seed_compiler.generator import Generator
+from seed_compiler.profiler import TemplateProfiler
+from seed_compiler.cache import RenderCache, context_hash
+
+def make_spec(app_name):
+    return {
+        'app': {'name': app_name, 'title': f'{app_name} App'},
+        'models': [{
+            'name': 'Task',
+            'fields': [
+                {'name': 'title', 'type': 'text'},
+                {'name': 'done', 'type': 'bool', 'default': 'false'}
+            ]
+        }],
+        'screens': [{'name': 'Tasks', 'model': 'Task'}]
+    }
+
+def test_context_hash_is_canonical():
+    """Test that key order does not change the context hash"""
+    assert context_hash({'a': 1, 'b': [1, 2]}) == context_hash({'b': [1, 2], 'a': 1})
+    assert context_hash({'a': 1}) != context_hash({'a': 2})
+
+def test_repeated_renders_skip_jinja():
+    """Test that identical renders across generate() calls hit the cache"""
+    cache = RenderCache()
+    profiler = TemplateProfiler()
+    with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+        Generator(render_cache=cache, profiler=profiler).generate(make_spec('One'), first)
+        renders = {name: stats['calls'] for name, stats in profiler.templates.items()}
+        
+        Generator(render_cache=cache, profiler=profiler).generate(make_spec('Two'), second)
+        
+        # Model, screen and static templates were served from the cache
+        assert profiler.templates['Model.js.tmpl']['calls'] == renders['Model.js.tmpl']
+        assert profiler.templates['Screen.js.tmpl']['calls'] == renders['Screen.js.tmpl']
+        assert profiler.templates['ErrorBoundary.js.tmpl']['calls'] == 1
+        # App.js depends on the whole spec, which changed
+        assert profiler.templates['App.js.tmpl']['calls'] == 2
+        assert cache.hits > 0
+        
+        for path in ('src/models/Task.js', 'src/screens/Tasks.js'):
+            with open(os.path.join(first, path)) as a, open(os.path.join(second, path)) as b:
+                assert a.read() == b.read()
+
+def test_disk_cache_survives_new_instances():
+    """Test that on-disk entries are reused by a fresh cache"""
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as out:
+        Generator(render_cache=RenderCache(cache_dir=cache_dir)).generate(make_spec('One'), out)
+        
+        cache = RenderCache(cache_dir=cache_dir)
+        profiler = TemplateProfiler()
+        Generator(render_cache=cache, profiler=profiler).generate(make_spec('One'), out)
+        assert profiler.templates == {}
+        assert cache.misses == 0
+
+def test_large_renders_stream_uncached(monkeypatch):
+    """Test that renders over the cache limit are streamed in pieces and not cached"""
+    monkeypatch.setattr(generator_module, 'STREAM_BUFFER_SIZE', 256)
+    monkeypatch.setattr(generator_module, 'STREAM_CACHE_LIMIT', 1024)
+    cache = RenderCache()
+    generator = Generator(render_cache=cache)
+    outputs = generator._outputs(generator.analyzer.analyze(make_spec('One')))
+    screen = next(output for output in outputs if output['path'] == 'src/screens/Tasks.js')
+    
+    pieces = list(generator._render_chunks(screen['template'], screen['context']))
+    assert len(pieces) > 1
+    assert ''.join(pieces) == generator.env.get_template(screen['template']).render(**screen['context'])
+    assert cache.misses == 1 and len(cache._entries) == 0
+    
+    with tempfile.TemporaryDirectory() as out:
+        written = generator._write_output(out, 'stream.js', iter(pieces))
+        with open(os.path.join(out, 'stream.js'), 'rb') as f:
+            data = f.read()
+    assert written == {'size': len(data), 'sha256': hashlib.sha256(data).hexdigest()}
+
+def test_failed_stream_keeps_previous_output():
+    """Test that a render error partway through a stream leaves no partial file"""
+    def pieces():
+        yield 'const first = 1;\n'
+        raise RuntimeError('template failed')
+
+    generator = Generator()
+    with tempfile.TemporaryDirectory() as out:
+        generator._write_output(out, 'stream.js', 'previous')
+        with pytest.raises(RuntimeError, match='template failed'):
+            generator._write_output(out, 'stream.js', pieces())
+        assert os.listdir(out) == ['stream.js']
+        with open(os.path.join(out, 'stream.js')) as f:
+            assert f.read() == 'previous'
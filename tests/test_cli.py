@@ -57,9 +57,28 @@ def test_cli_verbose_output(capsys, tmp_path):
     
     # Run CLI with verbose flag
     with pytest.raises(SystemExit) as e:
-        main([str(input_file), '-v'])
+        main([str(input_file), '-v', '-o', str(tmp_path / "output")])
     
     captured = capsys.readouterr()
     assert "Reading input file" in captured.out
     assert "Parsing SeedSpec file" in captured.out
     assert "Successfully generated" in captured.out
+
+def test_cli_rejects_prefetch_without_lazy_routes(capsys, tmp_path):
+    """Test that --prefetch without --lazy-routes is reported instead of ignored"""
+    input_file = tmp_path / "test.seed"
+    input_file.write_text("""
+    app Todo "Todo App" {
+        model Task {
+            title text
+        }
+        screen Tasks using Task
+    }
+    """)
+
+    with pytest.raises(SystemExit) as e:
+        main([str(input_file), '--prefetch', '-o', str(tmp_path / "output")])
+
+    assert e.value.code == 1
+    assert "Error: prefetch requires lazy_routes" in capsys.readouterr().err
+    assert not (tmp_path / "output").exists()
@@ -0,0 +1,102 @@
+import os
+import json
+import tempfile
+import pytest
+from seed_compiler.parser import SeedParser, ParseError
+from seed_compiler.analyzer import Analyzer, AnalysisError
+from seed_compiler.generator import Generator
+from seed_compiler.data import read_records, release_data
+
+def todo_app(records):
+    return f"""
+    app TodoApp "Todo List" {{
+        model Todo {{
+            title text as title
+            done bool = false
+            points num
+        }}
+        data {{
+            Todos: Todo[] [
+{records}
+            ]
+        }}
+        screen Todos using Todo
+    }}
+    """
+
+def test_parse_data_block():
+    """Test that data records are streamed into data sets, including multi-line records"""
+    spec = SeedParser().parse(todo_app("""
+                { title: "Read // write", points: 3 },  // comment
+                { id: t2, title: "Multi-line"
+                  , done: true }
+    """))
+
+    data_set = spec['data'][0]
+    assert (data_set['name'], data_set['model'], data_set['count']) == ('Todos', 'Todo', 2)
+    assert list(read_records(data_set)) == [
+        {'title': 'Read // write', 'points': '3'},
+        {'id': 't2', 'title': 'Multi-line', 'done': 'true'}
+    ]
+
+    with pytest.raises(ParseError, match="Expected ',' or '}' after a field value") as e:
+        SeedParser().parse(todo_app('{ title: "a" points: 1 }'))
+    assert e.value.line_num == 9
+    with pytest.raises(ParseError, match="Unclosed data set"):
+        SeedParser().parse('app A "A" {\n  data {\n    Todos: Todo[] [\n      { title: "a" }\n')
+    with pytest.raises(AnalysisError, match="Record 1 of 'Todos' has invalid num value for 'points': many"):
+        Analyzer().analyze(SeedParser().parse(todo_app('{ title: "a", points: many }')))
+    with pytest.raises(AnalysisError, match="Record 2 of 'Todos' has unknown field 'owner'"):
+        Analyzer().analyze(SeedParser().parse(todo_app('{ title: "a" },\n{ owner: "b" }')))
+
+def test_generate_chunked_data(tmp_path):
+    """Test that seed data is written as JSON chunks the model store loads on demand"""
+    records = ',\n'.join(f'{{ title: "Task {i}", points: {i} }}' for i in range(5))
+    spec = SeedParser().parse(todo_app(records))
+    Generator(data_chunk_size=2).generate(spec, str(tmp_path))
+
+    data_dir = tmp_path / 'public' / 'data' / 'Todos'
+    assert sorted(os.listdir(data_dir)) == ['0.json', '1.json', '2.json']
+    chunk = json.loads((data_dir / '0.json').read_text())
+    assert chunk == [
+        {'id': 'Todos-1', 'title': 'Task 0', 'points': 0, 'done': False},
+        {'id': 'Todos-2', 'title': 'Task 1', 'points': 1, 'done': False}
+    ]
+
+    model = (tmp_path / 'src' / 'models' / 'Todo.js').read_text()
+    assert "{ name: 'Todos', chunks: 3 }" in model
+    assert 'fetchSeedChunk' in model
+    assert 'Task 0' not in model
+    # Seed records stay out of the localStorage blob; only the user's changes are saved
+    assert "items.filter(item => seeds.get(item.id) !== item)" in model
+    assert "const REMOVED_KEY = 'todos:removed';" in model
+    assert 'SEEDED_KEY' not in model
+
+    manifest = json.loads((tmp_path / 'seed-manifest.json').read_text())
+    assert manifest['files']['public/data/Todos/2.json']['sources'] == ['data:Todos']
+    assert 'data:Todos' in manifest['files']['src/models/Todo.js']['sources']
+
+def test_data_sets_are_plain_descriptors():
+    """Test that each read of a data set has its own reader and release removes the records file"""
+    records = ',\n'.join(f'{{ title: "Task {i}", points: {i} }}' for i in range(3))
+    spec = SeedParser().parse(todo_app(records))
+    ir = Analyzer().analyze(spec)
+    data_set = ir['data'][0]
+
+    first, second = read_records(data_set), read_records(data_set)
+    assert [next(first)['title'], next(second)['title'], next(first)['title']] == ['Task 0', 'Task 0', 'Task 1']
+    first.close()
+    second.close()
+
+    release_data(ir)
+    assert not os.path.exists(data_set['path'])
+    release_data(spec)
+
+def test_failed_parse_removes_record_files(tmp_path, monkeypatch):
+    """Test that no record files are left behind when parsing fails"""
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    with pytest.raises(ParseError):
+        SeedParser().parse(todo_app('{ title: "a" },\n{ title: "b" }\n            ]\n            Broken: Todo[] [\n{ title: "c" points: 1 }'))
+    with pytest.raises(ParseError):
+        SeedParser().parse(todo_app('{ title: "a" }').replace('screen Todos using Todo', 'screen Todos using'))
+    assert list(tmp_path.iterdir()) == []
@@ -123,6 +123,23 @@ def test_generator_model_content(basic_spec):
             assert 'update' in content
             assert 'remove' in content
 
+def test_generator_model_ids(basic_spec):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generator = Generator()
+        generator.generate(basic_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'src/utils/id.js')) as f:
+            content = f.read()
+            assert 'export function generateId()' in content
+            assert 'export function findPosition(' in content
+        
+        with open(os.path.join(tmpdir, 'src/models/Task.js')) as f:
+            content = f.read()
+            assert "import { generateId, buildIndex, findPosition } from '../utils/id';" in content
+            assert 'id: generateId()' in content
+            assert 'Date.now()' not in content
+            assert 'findPosition(prev, indexRef.current, id)' in content
+
 def test_generator_screen_content(basic_spec, email_spec):
     with tempfile.TemporaryDirectory() as tmpdir:
         generator = Generator()
@@ -153,6 +170,30 @@ def test_generator_package_json(basic_spec):
             assert '"react-dom"' in content
             assert '"react-router-dom"' in content
 
+def test_generator_lazy_routes(basic_spec):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generator = Generator(lazy_routes=True, prefetch=True)
+        generator.generate(basic_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'src/App.js')) as f:
+            content = f.read()
+            assert "import { Tasks } from './screens/Tasks'" not in content
+            assert "const loadTasks = () => import('./screens/Tasks');" in content
+            assert 'const Tasks = lazy(' in content
+            assert '<Suspense' in content
+            assert 'onMouseEnter={loadTasks}' in content
+
+        # Static imports stay the default
+        Generator().generate(basic_spec, tmpdir)
+        with open(os.path.join(tmpdir, 'src/App.js')) as f:
+            content = f.read()
+            assert "import { Tasks } from './screens/Tasks'" in content
+            assert 'Suspense' not in content
+
+    # Prefetching needs lazy screens to prefetch
+    with pytest.raises(ValueError, match="prefetch requires lazy_routes"):
+        Generator(prefetch=True)
+
 # Theme Generation Tests
 def test_generator_creates_theme_files(themed_app_spec):
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -249,3 +290,35 @@ def test_generator_dark_mode_support(themed_app_spec):
             assert 'dark:' in content
             assert 'prefers-color-scheme' in content
             assert 'setDarkMode' in content
+
+def test_generator_manifest(basic_spec):
+    import hashlib
+    import json
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generator = Generator()
+        generator.generate(basic_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'seed-manifest.json')) as f:
+            manifest = json.load(f)
+        
+        assert set(manifest['nodes']) == {'app', 'model:Task', 'screen:Tasks'}
+        screen_entry = manifest['files']['src/screens/Tasks.js']
+        assert screen_entry['sources'] == ['screen:Tasks', 'model:Task']
+        assert manifest['files']['package.json']['sources'] == []
+        assert 'seed-manifest.json' not in manifest['files']
+        
+        # Sizes and hashes match the files on disk
+        for path, entry in manifest['files'].items():
+            with open(os.path.join(tmpdir, path), 'rb') as f:
+                data = f.read()
+            assert entry['size'] == len(data)
+            assert entry['sha256'] == hashlib.sha256(data).hexdigest()
+        
+        # Changing one model only changes that node's hash
+        basic_spec['models'][0]['fields'].append({'name': 'notes', 'type': 'text'})
+        generator.generate(basic_spec, tmpdir)
+        with open(os.path.join(tmpdir, 'seed-manifest.json')) as f:
+            updated = json.load(f)
+        assert updated['nodes']['app'] == manifest['nodes']['app']
+        assert updated['nodes']['model:Task'] != manifest['nodes']['model:Task']
+        assert updated['files']['src/index.js'] == manifest['files']['src/index.js']
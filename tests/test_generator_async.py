@@ -0,0 +1,81 @@
+import pytest
+import os
+import time
+import asyncio
+import tempfile
+import threading
+from seed_compiler.generator import Generator
+
+@pytest.fixture
+def basic_spec():
+    return {
+        'app': {'name': 'Todo', 'title': 'Todo App'},
+        'models': [{
+            'name': 'Task',
+            'fields': [
+                {'name': 'title', 'type': 'text'},
+                {'name': 'done', 'type': 'bool', 'default': 'false'}
+            ]
+        }],
+        'screens': [
+            {'name': 'Tasks', 'model': 'Task'},
+            {'name': 'Archive', 'model': 'Task'}
+        ]
+    }
+
+def read_tree(root):
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            with open(path) as f:
+                files[os.path.relpath(path, root)] = f.read()
+    return files
+
+def test_generate_async_matches_generate(basic_spec):
+    """Test that interleaved async compiles produce the same tree as generate()"""
+    with tempfile.TemporaryDirectory() as sync_dir, \
+         tempfile.TemporaryDirectory() as first, \
+         tempfile.TemporaryDirectory() as second:
+        generator = Generator()
+        generator.generate(basic_spec, sync_dir)
+        
+        async def compile_both():
+            await asyncio.gather(
+                generator.generate_async(basic_spec, first, concurrency=2),
+                generator.generate_async(basic_spec, second, concurrency=2)
+            )
+        asyncio.run(compile_both())
+        
+        expected = read_tree(sync_dir)
+        assert 'src/screens/Archive.js' in expected
+        assert read_tree(first) == expected
+        assert read_tree(second) == expected
+
+def test_generate_async_bounds_concurrent_writes(basic_spec):
+    """Test that no more than `concurrency` writes run at once"""
+    class SlowWriteGenerator(Generator):
+        def __init__(self):
+            super().__init__()
+            self.lock = threading.Lock()
+            self.active = 0
+            self.peak = 0
+        
+        def _write_output(self, output_dir, path, content):
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.01)
+            written = super()._write_output(output_dir, path, content)
+            with self.lock:
+                self.active -= 1
+            return written
+    
+    generator = SlowWriteGenerator()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        asyncio.run(generator.generate_async(basic_spec, tmpdir, concurrency=3))
+        assert os.path.exists(os.path.join(tmpdir, 'package.json'))
+    assert 1 < generator.peak <= 3
+    
+    with pytest.raises(ValueError):
+        asyncio.run(generator.generate_async(basic_spec, tmpdir, concurrency=0))
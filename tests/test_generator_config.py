@@ -146,3 +146,25 @@ def test_index_js(basic_spec):
             assert '<React.StrictMode>' in content
             # Check for root element access, independent of quote style
             assert any(variant in content for variant in ["document.getElementById('root')", 'document.getElementById("root")'])
+
+def test_static_css(basic_spec):
+    """Test precompiled stylesheet generation without the CDN script"""
+    from seed_compiler.css import build_stylesheet, collect_classes
+    assert collect_classes('<div className="p-4 {{ x }} md:flex">') == {'p-4', 'md:flex'}
+    css = build_stylesheet({'bg-indigo-600', 'hover:bg-indigo-700', 'md:grid-cols-2', 'not-a-utility'})
+    assert '.bg-indigo-600 { background-color: #4f46e5; }' in css
+    assert '.hover\\:bg-indigo-700:hover { background-color: #4338ca; }' in css
+    assert '@media (min-width: 768px) {\n  .md\\:grid-cols-2' in css
+    assert 'not-a-utility' not in css
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generator = Generator(static_css=True)
+        generator.generate(basic_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'public/index.html')) as f:
+            assert 'cdn.tailwindcss.com' not in f.read()
+        with open(os.path.join(tmpdir, 'src/index.css')) as f:
+            content = f.read()
+            assert '@tailwind' not in content
+            assert '.bg-indigo-600' in content
+            assert '.focus\\:ring-indigo-500:focus' in content
@@ -135,3 +135,188 @@ def test_loading_states(form_spec):
             assert 'loading' in content.lower()
             assert 'disabled=' in content
             assert 'useState' in content
+
+def test_list_pagination_sort_filter(form_spec):
+    """Test that paginated, sorted and filtered lists are memoized"""
+    form_spec['screens'][0].update({
+        'paginate': 25,
+        'sort': {'field': 'age', 'direction': 'desc'},
+        'filter': 'name'
+    })
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generator = Generator()
+        generator.generate(form_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'src/screens/Users.js')) as f:
+            content = f.read()
+            
+            assert 'const PAGE_SIZE = 25;' in content
+            assert 'const visibleItems = useMemo(' in content
+            assert 'compareValues(a.age, b.age)' in content
+            assert "useState('desc')" in content
+            assert 'item.name' in content
+            assert 'visibleItems.slice(' in content
+            assert 'pageItems.map(' in content
+
+def test_memoized_rows_and_stable_callbacks(form_spec):
+    """Test that rows are memoized and model callbacks keep their identity"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generator = Generator()
+        generator.generate(form_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'src/screens/Users.js')) as f:
+            content = f.read()
+            assert 'const UsersRow = React.memo(function UsersRow(' in content
+            assert '<UsersRow' in content
+            assert 'isEditing={editingId === item.id}' in content
+        
+        with open(os.path.join(tmpdir, 'src/models/User.js')) as f:
+            content = f.read()
+            # Updaters read the previous state instead of closing over items
+            assert 'setItems(prev =>' in content
+            assert '[items, persistItems]' not in content
+            assert '}, []);' in content
+
+def test_bulk_operations(form_spec):
+    """Test that model hooks expose bulk operations used for bulk delete"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generator = Generator()
+        generator.generate(form_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'src/models/User.js')) as f:
+            content = f.read()
+            for name in ('createMany', 'updateMany', 'removeMany', 'replaceAll'):
+                assert f'const {name} = useCallback(' in content
+            assert 'return { items, create, update, remove, createMany, updateMany, removeMany, replaceAll' in content
+            # Replacement items get the field defaults whether or not they have an id
+            assert 'newItems.map(item => ({ ...DEFAULTS, ...item, id: item.id || generateId() }))' in content
+        
+        with open(os.path.join(tmpdir, 'src/screens/Users.js')) as f:
+            content = f.read()
+            assert 'await store.removeMany([...selectedIds]);' in content
+            assert 'selected={selectedIds.has(item.id)}' in content
+            assert 'Delete selected' in content
+
+def test_indexed_field_lookups(form_spec):
+    """Test that indexed fields get maintained secondary indexes and findBy helpers"""
+    form_spec['models'][0]['fields'][1]['indexed'] = True
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator().generate(form_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'src/models/User.js')) as f:
+            content = f.read()
+            assert "fieldIndexesRef.current = buildFieldIndexes(items, ['email']);" in content
+            assert 'unindexItem(fieldIndexesRef.current, prev[position]);' in content
+            assert "findByField(items, indexRef.current, fieldIndexesRef.current, 'email', value)" in content
+            assert 'getById, findByEmail' in content
+        
+        with open(os.path.join(tmpdir, 'src/utils/id.js')) as f:
+            assert 'export function findByField(' in f.read()
+
+def test_search_index(form_spec):
+    """Test that searchable fields get an inverted index in the store and a search box"""
+    for field in form_spec['models'][0]['fields'][:2]:
+        field['searchable'] = True
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator().generate(form_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'src/models/User.js')) as f:
+            content = f.read()
+            assert "searchIndexRef.current = buildSearchIndex(items, ['name', 'email']);" in content
+            assert 'unindexForSearch(searchIndexRef.current, prev[position]);' in content
+            assert 'getById, search }' in content
+        
+        with open(os.path.join(tmpdir, 'src/screens/Users.js')) as f:
+            content = f.read()
+            assert 'let result = search(searchText);' in content
+            assert 'placeholder="Search name, email"' in content
+        
+        with open(os.path.join(tmpdir, 'src/utils/search.js')) as f:
+            assert 'export function searchIds(' in f.read()
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        form_spec['models'][0]['fields'][0]['searchable'] = False
+        form_spec['models'][0]['fields'][1]['searchable'] = False
+        Generator().generate(form_spec, tmpdir)
+        assert not os.path.exists(os.path.join(tmpdir, 'src/utils/search.js'))
+
+def test_storage_worker(form_spec):
+    """Test that the storage worker option moves persistence off localStorage"""
+    form_spec['models'][0]['fields'][1]['indexed'] = True
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator(storage_worker=True).generate(form_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'src/models/User.js')) as f:
+            content = f.read()
+            assert 'localStorage' not in content
+            assert 'loadItems(COLLECTION, chunk => {' in content
+            assert 'saveChanges(COLLECTION, { patch: [{ ...data, id }] });' in content
+            assert 'query, loading }' in content
+        
+        with open(os.path.join(tmpdir, 'src/utils/storage.worker.js')) as f:
+            content = f.read()
+            assert "users: ['email']," in content
+            assert "self.postMessage({ type: 'chunk', requestId, items: chunk });" in content
+            assert 'JSON.stringify' not in content
+        assert os.path.exists(os.path.join(tmpdir, 'src/utils/storage.js'))
+    
+    with pytest.raises(ValueError, match="cannot be combined with a backend"):
+        Generator(storage_worker=True, backend='sqlite')
+
+def test_sync_tabs(form_spec):
+    """Test that store copies exchange per-change deltas when tab sync is enabled"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator(sync_tabs=True).generate(form_spec, tmpdir)
+        
+        with open(os.path.join(tmpdir, 'src/models/User.js')) as f:
+            content = f.read()
+            assert "broadcast({ type: 'create', items: [newItem] });" in content
+            assert "broadcast({ type: 'update', changes: [{ ...data, id }] });" in content
+            assert "const channel = openChannel('users', delta => {" in content
+            assert "else if (delta.type === 'remove') applyRemovals(delta.ids);" in content
+        assert os.path.exists(os.path.join(tmpdir, 'src/utils/sync.js'))
+    
+    # Models without references, and with several, import openChannel exactly once
+    form_spec['models'] += [
+        {'name': 'Tag', 'fields': [{'name': 'label', 'type': 'text'}]},
+        {'name': 'Task', 'fields': [
+            {'name': 'title', 'type': 'text'},
+            {'name': 'owner', 'type': 'User'},
+            {'name': 'tag', 'type': 'Tag'}
+        ]}
+    ]
+    sync_import = "import { openChannel } from '../utils/sync';"
+    for backend in (None, 'sqlite'):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Generator(sync_tabs=True, backend=backend).generate(form_spec, tmpdir)
+            for model in ('User', 'Tag', 'Task'):
+                with open(os.path.join(tmpdir, f'src/models/{model}.js')) as f:
+                    assert f.read().count(sync_import) == 1
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator().generate(form_spec, tmpdir)
+        with open(os.path.join(tmpdir, 'src/models/User.js')) as f:
+            content = f.read()
+            assert 'broadcast' not in content
+            assert 'openChannel' not in content
+
+def test_shared_components(form_spec):
+    """Test that screens use the shared component library when enabled"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator(shared_components=True).generate(form_spec, tmpdir)
+        
+        for component in ['FormField', 'ReferenceSelect', 'ItemRow']:
+            assert os.path.exists(os.path.join(tmpdir, f'src/components/{component}.js'))
+        
+        with open(os.path.join(tmpdir, 'src/screens/Users.js')) as f:
+            content = f.read()
+            assert "import { FormField } from '../components/FormField';" in content
+            assert "{ name: 'age', label: 'Age', type: 'num', inputType: 'number'" in content
+            assert "defaultValue: true" in content
+            assert '<ItemRow' in content
+            assert 'UserRow' not in content
+            assert 'focus:border-indigo-500' not in content
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator().generate(form_spec, tmpdir)
+        assert not os.path.exists(os.path.join(tmpdir, 'src/components/ItemRow.js'))
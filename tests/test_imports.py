@@ -0,0 +1,115 @@
+import os
+import threading
+import pytest
+from seed_compiler.parser import SeedParser, ParseError
+from seed_compiler.modules import ModuleCache
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+def test_import_models_from_files(tmp_path):
+    """Test whole-file and named imports, including referenced models"""
+    write(tmp_path / "shared" / "customers.seed", """
+    model Address {
+        city text
+    }
+    model Customer {
+        name text as title
+        address Address
+    }
+    model Supplier {
+        name text
+    }
+    """)
+    app = write(tmp_path / "app.seed", """
+    import { Customer } from "./shared/customers.seed"
+    app Shop "Shop" {
+        model Order {
+            customer Customer
+        }
+        screen Orders using Order
+    }
+    """)
+
+    spec = SeedParser().parse_file(str(app))
+    assert [m['name'] for m in spec['models']] == ['Customer', 'Address', 'Order']
+    assert spec['imports'][0]['names'] == ['Customer']
+
+    app.write_text("""
+    app Shop "Shop" {
+        import "./shared/customers"
+        screen Suppliers using Supplier
+    }
+    """)
+    spec = SeedParser().parse_file(str(app))
+    assert [m['name'] for m in spec['models']] == ['Address', 'Customer', 'Supplier']
+
+def test_import_errors(tmp_path):
+    """Test missing files, unknown names, duplicates and invalid libraries"""
+    write(tmp_path / "lib.seed", "model Customer {\n name text\n}")
+    parser = SeedParser()
+
+    with pytest.raises(ParseError) as e:
+        parser.parse('import "./missing.seed"\napp Shop "Shop" {\n}', base_dir=str(tmp_path))
+    assert "Imported file not found" in str(e.value)
+    assert e.value.line_num == 1
+
+    with pytest.raises(ParseError) as e:
+        parser.parse('import { Vendor } from "./lib.seed"\napp Shop "Shop" {\n}', base_dir=str(tmp_path))
+    assert "'Vendor' is not defined" in str(e.value)
+
+    with pytest.raises(ParseError) as e:
+        parser.parse('import "./lib.seed"\napp Shop "Shop" {\n model Customer {\n name text\n }\n}',
+                     base_dir=str(tmp_path))
+    assert "Duplicate model name: Customer" in str(e.value)
+
+    write(tmp_path / "bad.seed", 'app Other "Other" {\n}')
+    with pytest.raises(ParseError) as e:
+        parser.parse('import "./bad.seed"\napp Shop "Shop" {\n}', base_dir=str(tmp_path))
+    assert "cannot declare an app" in str(e.value)
+
+def test_imported_modules_are_cached(tmp_path):
+    """Test that shared and unchanged files are parsed once"""
+    write(tmp_path / "base.seed", "model Address {\n city text\n}")
+    write(tmp_path / "a.seed", 'import "./base.seed"\nmodel Customer {\n address Address\n}')
+    write(tmp_path / "b.seed", 'import "./base.seed"\nmodel Supplier {\n address Address\n}')
+    app = write(tmp_path / "app.seed", 'import "./a.seed"\nimport "./b.seed"\napp Shop "Shop" {\n}')
+
+    cache = ModuleCache()
+    parser = SeedParser(module_cache=cache)
+    spec = parser.parse_file(str(app))
+    assert [m['name'] for m in spec['models']] == ['Address', 'Customer', 'Supplier']
+    assert cache.parses == 3
+
+    # Unchanged (or only touched) files are not parsed again
+    parser.parse_file(str(app))
+    stat = os.stat(tmp_path / "base.seed")
+    os.utime(tmp_path / "base.seed", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    SeedParser(module_cache=cache).parse_file(str(app))
+    assert cache.parses == 3
+
+    # Edited files are
+    write(tmp_path / "base.seed", "model Address {\n city text\n zip text\n}")
+    spec = parser.parse_file(str(app))
+    assert cache.parses == 4
+    assert [f['name'] for f in spec['models'][0]['fields']] == ['city', 'zip']
+
+def test_imports_resolve_in_order_on_the_calling_thread(tmp_path):
+    """Test that imported files are loaded one after another, level by level"""
+    write(tmp_path / "base.seed", "model Address {\n city text\n}")
+    write(tmp_path / "a.seed", 'import "./base.seed"\nmodel Customer {\n address Address\n}')
+    write(tmp_path / "b.seed", 'import "./base.seed"\nmodel Supplier {\n address Address\n}')
+    app = write(tmp_path / "app.seed", 'import "./a.seed"\nimport "./b.seed"\napp Shop "Shop" {\n}')
+
+    loads = []
+
+    class RecordingCache(ModuleCache):
+        def load(self, path, parse_module):
+            loads.append((os.path.basename(path), threading.current_thread()))
+            return super().load(path, parse_module)
+
+    SeedParser(module_cache=RecordingCache()).parse_file(str(app))
+    assert [name for name, _ in loads] == ['a.seed', 'b.seed', 'base.seed']
+    assert all(thread is threading.current_thread() for _, thread in loads)
@@ -92,6 +92,27 @@ def test_email_field_parsing():
     spec = parser.parse(input_text)
     assert spec['models'][0]['fields'][1]['type'] == 'email'
 
+def test_indexed_field_modifier():
+    parser = SeedParser()
+    spec = parser.parse("""
+    app Crm "CRM" {
+        model Contact {
+            name text as title indexed
+            email email indexed = "a@b.io"
+            notes text
+        }
+    }
+    """)
+    name, email, notes = spec['models'][0]['fields']
+    assert name['is_title'] and name['indexed']
+    assert email['indexed'] and email['default'] == 'a@b.io'
+    assert 'indexed' not in notes
+    
+    with pytest.raises(ParseError, match="Duplicate field modifier: 'indexed'"):
+        parser.parse('app A "A" {\n  model M {\n    email email indexed indexed\n  }\n}')
+    with pytest.raises(ParseError, match="Only text and email fields can be searchable, 'n' is num"):
+        parser.parse('app A "A" {\n  model M {\n    n num searchable\n  }\n}')
+
 # Theme Parsing Tests
 def test_basic_theme_parsing():
     parser = SeedParser()
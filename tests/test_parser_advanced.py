@@ -169,3 +169,116 @@ def test_comments():
     assert len(spec['models']) == 2
     user_model = next(m for m in spec['models'] if m['name'] == 'User')
     assert len(user_model['fields']) == 2
+
+def test_screen_list_options():
+    """Test paginate, sort and filter screen options"""
+    parser = SeedParser()
+    spec = parser.parse("""
+    app Todo "Todo App" {
+        model Task {
+            title text
+            dueDate text
+        }
+        screen Tasks using Task paginate 50 sort dueDate desc filter title
+        screen AllTasks using Task sort title
+    }
+    """)
+    
+    tasks = spec['screens'][0]
+    assert tasks['paginate'] == 50
+    assert tasks['sort'] == {'field': 'dueDate', 'direction': 'desc'}
+    assert tasks['filter'] == 'title'
+    
+    all_tasks = spec['screens'][1]
+    assert all_tasks['sort'] == {'field': 'title', 'direction': 'asc'}
+    assert 'paginate' not in all_tasks
+    
+    # Invalid page size
+    with pytest.raises(ParseError) as e:
+        parser.parse("""
+        app Todo "Todo App" {
+            screen Tasks using Task paginate 0
+        }
+        """)
+    assert "positive integer" in str(e.value)
+    
+    # Unknown option
+    with pytest.raises(ParseError) as e:
+        parser.parse("""
+        app Todo "Todo App" {
+            screen Tasks using Task group title
+        }
+        """)
+    assert "Unknown screen option" in str(e.value)
+
+def test_parse_file_matches_parse(tmp_path):
+    """Test that memory-mapped file input parses like string input"""
+    parser = SeedParser()
+    input_text = '\r\n\r\napp Todo "Todo App" {\r\n    model Task {\r\n        title text  // note\r\n    }\r\n    screen Tasks using Task\r\n}\r\n'
+    path = tmp_path / "todo.seed"
+    path.write_bytes(input_text.encode('utf-8'))
+    assert parser.parse_file(str(path)) == parser.parse(input_text)
+
+    path.write_text('app Todo "Todo App" {\n    model Task {\n        title unknown!\n    }\n}\n')
+    with pytest.raises(ParseError) as e:
+        parser.parse_file(str(path))
+    assert e.value.line_num == 3
+    assert e.value.prev_line.strip() == 'model Task {'
+    assert e.value.next_line.strip() == '}'
+
+    path.write_text('')
+    with pytest.raises(ParseError) as e:
+        parser.parse_file(str(path))
+    assert "Empty input" in str(e.value)
+
+def test_identifiers_are_interned():
+    """Test that repeated names and types share one string object"""
+    parser = SeedParser()
+    spec = parser.parse("""
+    app Shop "Shop" {
+        model Customer {
+            name text
+        }
+        model Order {
+            name text
+            customer Customer
+        }
+        screen Orders using Order
+    }
+    """)
+    customer, order = spec['models']
+    assert customer['fields'][0]['name'] is order['fields'][0]['name']
+    assert customer['fields'][0]['type'] is order['fields'][0]['type']
+    assert order['fields'][1]['type'] is customer['name']
+    assert spec['screens'][0]['model'] is order['name']
+
+def test_field_type_registry():
+    """Test date fields and registering a new field type"""
+    from seed_compiler.field_types import FIELD_TYPES, TypeDescriptor, register_type
+    from seed_compiler.generator import Generator
+    parser = SeedParser()
+    spec = parser.parse("""
+    app Todo "Todo App" {
+        model Task {
+            due date = "2024-05-01"
+            done bool = TRUE
+        }
+    }
+    """)
+    due, done = spec['models'][0]['fields']
+    assert (due['default'], due['is_reference']) == ('2024-05-01', False)
+    assert done['default'] == 'true'
+    with pytest.raises(ParseError) as e:
+        parser.parse('app Todo "Todo App" {\n model Task {\n due date = "May 1st"\n }\n}')
+    assert "Invalid default value for date field" in str(e.value)
+
+    register_type(TypeDescriptor('money', 'number', lambda value: value if value.isdigit() else None, str))
+    try:
+        spec = parser.parse('app Shop "Shop" {\n model Item {\n price money = 5\n }\n}')
+        field = spec['models'][0]['fields'][0]
+        generator = Generator()
+        assert field['is_reference'] is False
+        assert generator._input_type_for_field('money') == 'number'
+        assert generator._default_value_for_field(field) == '5'
+    finally:
+        del FIELD_TYPES['money']
@@ -0,0 +1,70 @@
+import pytest
+import os
+import tempfile
+from seed_compiler.generator import Generator
+from seed_compiler.profiler import TemplateProfiler
+
+@pytest.fixture
+def basic_spec():
+    return {
+        'app': {'name': 'Todo', 'title': 'Todo App'},
+        'models': [{
+            'name': 'Task',
+            'fields': [
+                {'name': 'title', 'type': 'text'},
+                {'name': 'done', 'type': 'bool', 'default': 'false'}
+            ]
+        }],
+        'screens': [
+            {'name': 'Tasks', 'model': 'Task'},
+            {'name': 'Archive', 'model': 'Task'}
+        ]
+    }
+
+def test_profiler_records_templates(basic_spec):
+    """Test that each template's calls, time and output size are recorded"""
+    profiler = TemplateProfiler()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator(profiler=profiler).generate(basic_spec, tmpdir)
+    
+    screen_stats = profiler.templates['Screen.js.tmpl']
+    assert screen_stats['calls'] == 2
+    assert screen_stats['bytes'] > 0
+    assert screen_stats['seconds'] > 0
+    assert profiler.templates['App.js.tmpl']['calls'] == 1
+    # Block timing is off unless requested
+    assert profiler.block_stats == {}
+
+def test_profiler_block_timing_and_report(basic_spec):
+    """Test per-block timing and the ranked report"""
+    profiler = TemplateProfiler(blocks=True)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator(profiler=profiler).generate(basic_spec, tmpdir)
+    
+    assert profiler.block_stats['Screen.js.tmpl:row']['calls'] == 2
+    assert profiler.block_stats['Screen.js.tmpl:create-fields']['bytes'] > 0
+    assert 'App.js.tmpl:routes' in profiler.block_stats
+    
+    report = profiler.report()
+    assert 'Template render profile' in report
+    assert 'Screen.js.tmpl:row-fields' in report
+    # Rows are ranked by total time
+    template_rows = report.split('\n\n')[0].splitlines()[2:]
+    times = [float(row.split()[2]) for row in template_rows]
+    assert times == sorted(times, reverse=True)
+
+def test_profile_tags_leave_no_blank_lines(basic_spec):
+    """Test that profile blocks and header tags do not add blank lines to generated files"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Generator().generate(basic_spec, tmpdir)
+        with open(os.path.join(tmpdir, 'src/screens/Tasks.js')) as f:
+            assert f.read().startswith(
+                "import React, { useState, useCallback } from 'react';\n"
+                "import { useTask } from '../models/Task';\n"
+                "\n"
+                "// Rows only rerender"
+            )
+        with open(os.path.join(tmpdir, 'src/App.js')) as f:
+            header = f.read().split('export default')[0]
+            assert header.startswith("import React from 'react';\n")
+            assert '\n\n\n' not in header
@@ -0,0 +1,90 @@
+import io
+import pytest
+from seed_compiler.parser import SeedParser
+from seed_compiler.analyzer import Analyzer
+from seed_compiler.modules import ModuleCache
+from seed_compiler.data import read_records, release_data
+from seed_compiler.serialize import dump, dumps, load, loads, SerializeError
+
+SPEC = """
+app Shop "Shop" {
+    model Customer {
+        name text as title
+        email email
+        vip bool = false
+    }
+    model Order {
+        customer Customer
+        total num = 9.5
+        note text = "none"
+    }
+    screen Orders using Order paginate 20 sort total desc filter note
+}
+"""
+
+def test_round_trip():
+    """Test that specs and IR survive encoding, with strings stored once"""
+    spec = SeedParser().parse(SPEC)
+    data = dumps(spec)
+    assert data.startswith(b'SEED')
+    assert loads(data) == spec
+    assert data.count(b'Customer') == 1
+
+    f = io.BytesIO()
+    dump(Analyzer().analyze(spec), f)
+    f.seek(0)
+    ir = load(f)
+    assert ir['screens'][0]['model']['name'] == 'Order'
+    assert ir['models'][1]['fields'][0] == {
+        'name': 'customer', 'type': 'Customer', 'default': None,
+        'is_title': False, 'is_reference': True, 'ref_index': 0
+    }
+
+def test_round_trip_with_data():
+    """Test that specs and IR with data blocks round-trip and still read their records"""
+    spec = SeedParser().parse(SPEC.replace(
+        "    screen Orders",
+        '    data {\n        Customers: Customer[] [ { name: "Ann", vip: true } ]\n    }\n    screen Orders'
+    ))
+    assert loads(dumps(spec)) == spec
+    ir = loads(dumps(Analyzer().analyze(spec)))
+    assert list(read_records(ir['data'][0])) == [{'name': 'Ann', 'vip': 'true'}]
+    assert ir['models'][0]['data_sets'][0]['count'] == 1
+    release_data(spec)
+
+def test_invalid_data():
+    """Test that foreign or damaged data is rejected"""
+    with pytest.raises(SerializeError):
+        loads(b'{"models": []}')
+    data = dumps(SeedParser().parse(SPEC))
+    with pytest.raises(SerializeError):
+        loads(data[:-3])
+    with pytest.raises(SerializeError):
+        dumps({'when': object()})
+
+    # A damaged string table is reported like any other corruption
+    corrupt = bytearray(data)
+    corrupt[13] = 0xff
+    with pytest.raises(SerializeError, match="Corrupt spec data"):
+        loads(bytes(corrupt))
+
+def test_module_cache_on_disk(tmp_path):
+    """Test that imported modules are reused from disk by a new cache"""
+    (tmp_path / "lib.seed").write_text("model Customer {\n name text as title\n}")
+    app = tmp_path / "app.seed"
+    app.write_text('import "./lib.seed"\napp Shop "Shop" {\n screen Customers using Customer\n}')
+
+    first = ModuleCache(cache_dir=str(tmp_path / "cache"))
+    spec = SeedParser(module_cache=first).parse_file(str(app))
+    second = ModuleCache(cache_dir=str(tmp_path / "cache"))
+    assert SeedParser(module_cache=second).parse_file(str(app)) == spec
+    assert (first.parses, second.parses) == (1, 0)
+
+    # A corrupt entry is parsed again instead of failing the build
+    for entry in (tmp_path / "cache").rglob("*.seedc"):
+        data = bytearray(entry.read_bytes())
+        data[13] = 0xff
+        entry.write_bytes(bytes(data))
+    third = ModuleCache(cache_dir=str(tmp_path / "cache"))
+    assert SeedParser(module_cache=third).parse_file(str(app)) == spec
+    assert third.parses == 1
@@ -0,0 +1,92 @@
+import pytest
+from seed_compiler.parser import SeedParser, ParseError
+from seed_compiler.analyzer import Analyzer, AnalysisError
+from seed_compiler import themes
+from seed_compiler.themes import ThemeResolver
+from seed_compiler.css import map_classes, map_classes_stream
+
+def test_theme_inheritance_resolution():
+    """Test that inheritance chains and color references resolve to hex values"""
+    themes = [
+        {'name': 'Final', 'extends': 'Middle', 'colors': {'accent': 'primary.dark'}},
+        {'name': 'Middle', 'extends': 'Default', 'colors': {'primary': '#0077BE', 'hover': 'primary.light'}},
+    ]
+    resolved = ThemeResolver().resolve_all(themes)
+
+    final = resolved['Final']
+    assert final['extends'] == 'Middle'
+    assert final['colors']['primary'] == '#0077be'
+    assert final['colors']['hover'] == '#4ca0d2'
+    assert final['colors']['accent'] == '#005385'
+    assert final['color_sources']['accent'] == 'primary.dark'
+    # Tokens the chain does not override come from the standard Default theme
+    assert final['colors']['secondary'] == '#228b22'
+    assert final['typography']['fonts']['body'] == 'sans'
+    assert final['radii']['full'] == '9999'
+
+    spec = SeedParser().parse("""
+    import { Default, Dark } from "@stdlib/themes"
+    app Todo "Todo" {
+        use theme Default
+        use theme Dark
+    }
+    """)
+    ir = Analyzer().analyze(spec)
+    assert ir['theme']['name'] == 'Default'
+    assert ir['dark_theme']['colors']['background'] == '#141414'
+
+def test_theme_resolution_errors():
+    """Test inheritance cycles, unknown bases, colors and standard library imports"""
+    resolver = ThemeResolver()
+    with pytest.raises(AnalysisError, match="Theme inheritance cycle: A -> B -> A"):
+        resolver.resolve_all([{'name': 'A', 'extends': 'B'}, {'name': 'B', 'extends': 'A'}])
+    with pytest.raises(AnalysisError, match="extends unknown theme 'Missing'"):
+        resolver.resolve_all([{'name': 'A', 'extends': 'Missing'}])
+    with pytest.raises(AnalysisError, match="Color reference cycle"):
+        resolver.resolve_all([{'name': 'A', 'colors': {'primary': 'accent', 'accent': 'primary.light'}}])
+    with pytest.raises(AnalysisError, match="unknown color 'sky'"):
+        resolver.resolve_all([{'name': 'A', 'colors': {'primary': 'sky'}}])
+    with pytest.raises(AnalysisError, match="unknown modifier 'glow'"):
+        resolver.resolve_all([{'name': 'A', 'colors': {'primary': 'white.glow'}}])
+    with pytest.raises(AnalysisError, match="Unknown theme: Missing"):
+        resolver.resolve_all([], used=['Missing'])
+
+    with pytest.raises(ParseError, match="'Sepia' is not defined in @stdlib/themes"):
+        SeedParser().parse('import { Sepia } from "@stdlib/themes"\napp Todo "Todo" {\n}')
+
+def test_theme_resolution_is_memoized(tmp_path, monkeypatch):
+    """Test that resolved themes are reused within and across builds"""
+    theme = {'name': 'Memo', 'extends': 'Default', 'colors': {'primary': '#123456'}}
+    ThemeResolver._memo.clear()
+
+    resolver = ThemeResolver(cache_dir=str(tmp_path))
+    first = resolver.resolve_all([theme])
+    assert resolver.misses == 2  # Default, then Memo
+    resolver.resolve_all([theme])
+    assert resolver.misses == 2
+
+    # A new process starts with an empty memo but finds the resolved themes on disk
+    ThemeResolver._memo.clear()
+    fresh = ThemeResolver(cache_dir=str(tmp_path))
+    assert fresh.resolve_all([theme]) == first
+    assert fresh.misses == 0
+
+    # Editing a theme only re-resolves that theme
+    fresh.resolve_all([{**theme, 'colors': {'primary': '#654321'}}])
+    assert fresh.misses == 1
+
+    # A compiler with other named colors or resolver logic ignores old entries
+    monkeypatch.setattr(themes, 'RESOLVER_KEY', '2:other')
+    ThemeResolver._memo.clear()
+    upgraded = ThemeResolver(cache_dir=str(tmp_path))
+    assert upgraded.resolve_all([theme]) == first
+    assert upgraded.misses == 2
+
+def test_class_map_stream_matches_whole_text():
+    """Test that class mapping over split text matches mapping the whole text"""
+    source = 'const TITLE_CLASS =\n  "text-sm p-4";\n<div className={`p-4 ${a ? "text-sm" : ""}`}>\n<b className=x />\n<i className="p-4"/>'
+    mapping = {'p-4': 'pad', 'text-sm': 'small body'}
+    expected = map_classes(source, mapping)
+    for size in range(1, len(source) + 1):
+        pieces = [source[i:i + size] for i in range(0, len(source), size)]
+        assert ''.join(map_classes_stream(pieces, mapping)) == expected